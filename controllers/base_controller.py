@@ -22,7 +22,7 @@ class BaseController:
             config: Optional configuration dictionary or object
         """
         self.config = config or {}
-        logger.debug(f"BaseController initialized with config: {self.config}")
+        logger.debug("BaseController initialized with config: %s", self.config)
 
     def update_config(self, new_config):
         """Update the controller's configuration.
@@ -38,7 +38,7 @@ class BaseController:
         else:
             self.config = new_config
 
-        logger.debug(f"BaseController config updated: {self.config}")
+        logger.debug("BaseController config updated: %s", self.config)
 
     def get_config_value(self, key, default=None):
         """Get a configuration value by key.
@@ -43,16 +43,16 @@ class EPGController(BaseController):
             bool: True if loading was successful, False otherwise
         """
         if not os.path.exists(file_path):
-            logger.error(f"EPG file not found: {file_path}")
+            logger.error("EPG file not found: %s", file_path)
             return False
 
         try:
             self.epg = EPGParser.parse(file_path)
             self.epg_path = file_path
-            logger.info(f"EPG loaded successfully from {file_path}")
+            logger.info("EPG loaded successfully from %s", file_path)
             return True
         except Exception as e:
-            logger.error(f"Failed to load EPG: {str(e)}")
+            logger.error("Failed to load EPG: %s", e)
             return False
 
     def reload_epg(self) -> bool:
@@ -78,11 +78,11 @@ class EPGController(BaseController):
             return
 
         if epg_id not in self.epg.channels:
-            logger.warning(f"EPG ID '{epg_id}' not found in EPG data")
+            logger.warning("EPG ID '%s' not found in EPG data", epg_id)
             return
 
         self.channel_map[channel.id] = epg_id
-        logger.debug(f"Mapped channel '{channel.name}' to EPG ID '{epg_id}'")
+        logger.debug("Mapped channel '%s' to EPG ID '%s'", channel.name, epg_id)
 
     def auto_map_channels(self, channels: List[Channel]) -> int:
         """Automatically map channels to EPG IDs based on channel name or ID.
@@ -121,7 +121,9 @@ class EPGController(BaseController):
                     mapped_count += 1
                     break
 
-        logger.info(f"Auto-mapped {mapped_count} of {len(channels)} channels to EPG data")
+        logger.info(
+            "Auto-mapped %d of %d channels to EPG data", mapped_count, len(channels)
+        )
         return mapped_count
 
     def get_epg_id_for_channel(self, channel: Channel) -> Optional[str]:
@@ -150,7 +152,7 @@ class EPGController(BaseController):
 
         epg_id = self.get_epg_id_for_channel(channel)
         if not epg_id:
-            logger.debug(f"No EPG mapping for channel: {channel.name}")
+            logger.debug("No EPG mapping for channel: %s", channel.name)
             return None
 
         # Apply time shift if available
@@ -175,7 +177,7 @@ class EPGController(BaseController):
 
         epg_id = self.get_epg_id_for_channel(channel)
         if not epg_id:
-            logger.debug(f"No EPG mapping for channel: {channel.name}")
+            logger.debug("No EPG mapping for channel: %s", channel.name)
             return []
 
         # Apply time shift if available
@@ -201,7 +203,7 @@ class EPGController(BaseController):
 
         epg_id = self.get_epg_id_for_channel(channel)
         if not epg_id:
-            logger.debug(f"No EPG mapping for channel: {channel.name}")
+            logger.debug("No EPG mapping for channel: %s", channel.name)
             return None
 
         # Apply time shift if channel has one
@@ -34,12 +34,6 @@ class PlayerController:
         # Initialize EPGController with config that includes the main window for UI updates
         self.epg_controller = EPGController(config={'window': main_window, 'settings': self.settings})
 
-        # Create search timer for debouncing
-        self.search_timer = QTimer()
-        self.search_timer.setSingleShot(True)
-        self.search_timer.setInterval(300)
-        self.search_timer.timeout.connect(self._perform_search)
-
         # Connect signals
         self._connect_signals()
 
@@ -50,8 +44,10 @@ class PlayerController:
         """Connect UI signals to their respective handlers."""
         # Playlist and channels
         self.window.category_combo.currentTextChanged.connect(self._category_changed)
-        self.window.channel_list.itemClicked.connect(self._channel_selected)
-        self.window.favorites_list.itemClicked.connect(self._favorite_selected)
+        self.window.channel_list.clicked.connect(self._channel_selected)
+        self.window.favorites_list.clicked.connect(self._favorite_selected)
+        self.window.channel_list.entered.connect(self._channel_hovered)
+        self.window.favorites_list.entered.connect(self._channel_hovered)
 
         # Playback controls
         self.window.play_button.clicked.connect(self.toggle_playback)
@@ -60,7 +56,7 @@ class PlayerController:
         self.window.favorite_button.clicked.connect(self._toggle_favorite)
 
         # Search
-        self.window.search_bar.textChanged.connect(self.search_timer.start)
+        self.window.search_bar.searchTriggered.connect(self._perform_search)
 
         # Menu actions
         self.window.playlist_manager_action.triggered.connect(
@@ -76,7 +72,11 @@ class PlayerController:
         """Load the initial application state."""
         # Load volume
         volume = int(self.settings.get_setting("volume", "100"))
+        # Restoring the slider must not echo back into a settings write
+        # and a volume notification
+        self.window.volume_slider.blockSignals(True)
         self.window.volume_slider.setValue(volume)
+        self.window.volume_slider.blockSignals(False)
         self.window.player_widget.set_volume(volume)
 
         # Load last playlist
@@ -101,7 +101,7 @@ class PlayerController:
         Args:
             playlist: The loaded playlist
         """
-        logger.debug(f"Playlist loaded with {len(playlist.channels)} channels")
+        logger.debug("Playlist loaded with %d channels", len(playlist.channels))
         if playlist and playlist.channels:
             self._map_channels_to_epg(playlist)
     
@@ -130,30 +130,28 @@ class PlayerController:
         self.playlist_controller.refresh_channels()
         self.settings.save_setting("last_category", category)
 
-    def _channel_selected(self, item):
-        if not item:
+    def _channel_selected(self, index):
+        channel = self.window.channel_list.model().channel_at(index.row())
+        if not channel:
             return
 
-        selected_name = item.text()
-        category = self.window.category_combo.currentText()
-        channels = (
-            self.playlist_controller.playlist.channels
-            if category == "All"
-            else self.playlist_controller.playlist.get_channels_by_category(category)
+        self.current_channel = channel
+        self._play_channel(channel)
+        self.window.favorite_button.setChecked(
+            self.settings.db.is_favorite(channel.url)
         )
 
-        for channel in channels:
-            if channel.name == selected_name:
-                self.current_channel = channel
-                self._play_channel(channel)
-                self.window.favorite_button.setChecked(
-                    self.settings.db.is_favorite(channel.url)
-                )
-                break
+    def _channel_hovered(self, index):
+        channel = index.model().channel_at(index.row())
+        if channel:
+            self.window.player_widget.warm_up(channel.url)
+
+    def _favorite_selected(self, index):
+        channel = self.window.favorites_list.model().channel_at(index.row())
+        if not channel:
+            return
 
-    def _favorite_selected(self, item):
-        favorites = self.settings.db.get_favorites()
-        self.current_channel = favorites[self.window.favorites_list.row(item)]
+        self.current_channel = channel
         self._play_channel(self.current_channel)
         self.window.favorite_button.setChecked(True)
 
@@ -191,14 +189,7 @@ class PlayerController:
         else:
             self.window.epg_widget.clear_current_program()
             
-        self.window.epg_widget.clear_upcoming_programs()
-        for program in upcoming_programs:
-            self.window.epg_widget.add_upcoming_program(
-                program.title,
-                program.start_time,
-                program.end_time,
-                program.description,
-            )
+        self.window.epg_widget.set_upcoming_programs(upcoming_programs)
 
     def _toggle_favorite(self, checked: bool):
         if not self.current_channel:
@@ -229,13 +220,17 @@ class PlayerController:
             )
 
     def _load_favorites(self):
-        self.window.favorites_list.clear()
-        for channel in self.settings.db.get_favorites():
-            self.window.favorites_list.addItem(channel.name)
+        self.window.favorites_list.model().set_channels(
+            self.settings.db.get_favorites()
+        )
+
+    def _perform_search(self, search_text: str):
+        """Perform the search operation and update the channel list based on the search text.
 
-    def _perform_search(self):
-        """Perform the search operation and update the channel list based on the search text."""
-        search_text = self.window.search_bar.text().lower()
+        Args:
+            search_text: The debounced search bar text.
+        """
+        search_text = search_text.lower()
 
         if not search_text:
             self.playlist_controller.refresh_channels()
@@ -256,9 +251,7 @@ class PlayerController:
         ]
 
         # Update list
-        self.window.channel_list.clear()
-        for channel in matched_channels:
-            self.window.channel_list.addItem(channel.name)
+        self.window.channel_list.model().set_channels(matched_channels)
 
     def toggle_playback(self):
         """Toggle playback between play and pause states."""
@@ -321,6 +314,11 @@ class PlayerController:
             if playlists:
                 success = self.settings.db.save_playlists(playlists)
                 if success:
+                    # Drop the local copies of URL playlists that were removed
+                    kept_urls = {path for _, path, is_url in playlists if is_url}
+                    for _, path, is_url in saved_playlists:
+                        if is_url and path not in kept_urls:
+                            self.playlist_controller.forget_cached_playlist(path)
                     self.window.show_notification(
                         f"Saved {len(playlists)} playlists successfully",
                         NotificationType.SUCCESS,
@@ -3,13 +3,12 @@ This module contains the PlaylistController class,
 which is responsible for loading and displaying the playlist data.
 """
 
-import os
-import tempfile
-import requests
+from pathlib import Path
 from requests.exceptions import RequestException, Timeout
 import logging
 from PyQt6.QtCore import QObject, pyqtSignal
 from models.playlist import Playlist
+from utils.downloader import cache_key, download_to_cache, playlist_cache_path
 from utils.m3u_parser import M3UParser
 from views.notification import NotificationType
 
@@ -28,6 +27,18 @@ class PlaylistController(QObject):
         self.settings = settings_controller
         self.playlist = Playlist()
 
+    def forget_cached_playlist(self, url: str):
+        """Remove the cached copy of a URL playlist and its stored validators.
+
+        Args:
+            url: The playlist URL.
+        """
+        try:
+            playlist_cache_path(url).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not remove cached playlist for %s: %s", url, e)
+        self.settings.delete_setting(f"playlist_cache:{cache_key(url)}")
+
     def load_playlist_from_path(self, path: str, is_url: bool = False, max_retries: int = 3) -> bool:
         """Load a playlist from a file path or URL.
         
@@ -39,50 +50,23 @@ class PlaylistController(QObject):
         Returns:
             bool: True if loading succeeded, False otherwise.
         """
-        tmp_path = None
         try:
             if is_url:
-                # Download playlist from URL with retry logic
-                logger.info(f"Downloading playlist from URL: {path}")
-                
-                for attempt in range(max_retries):
-                    try:
-                        logger.debug(f"Download attempt {attempt + 1}/{max_retries}")
-                        response = requests.get(path, timeout=30)
-                        response.raise_for_status()
-                        break
-                    except Timeout:
-                        if attempt < max_retries - 1:
-                            logger.warning(f"Timeout downloading playlist, retrying ({attempt + 1}/{max_retries})")
-                            continue
-                        else:
-                            logger.error(f"Failed to download playlist after {max_retries} attempts")
-                            raise TimeoutError(f"Timed out downloading playlist after {max_retries} attempts")
-                    except RequestException as e:
-                        logger.error(f"Request error: {str(e)}")
-                        raise RuntimeError(f"Error downloading playlist: {str(e)}")
-
-                # Save to temporary file
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=".m3u8"
-                ) as tmp_file:
-                    tmp_file.write(response.content)
-                    tmp_path = tmp_file.name
-                    logger.debug(f"Downloaded playlist saved to: {tmp_path}")
-
-                # Parse the temporary file
+                cache_path = self._fetch_cached_playlist(path, max_retries)
+
+                # Parse the cached file
                 logger.info("Parsing downloaded playlist")
-                self.playlist = M3UParser.parse(tmp_path)
+                self.playlist = M3UParser.parse(cache_path)
             else:
                 # Parse local file
-                logger.info(f"Loading playlist from local file: {path}")
+                logger.info("Loading playlist from local file: %s", path)
                 self.playlist = M3UParser.parse(path)
 
             # Save settings
             self.settings.save_setting("last_playlist", path)
             self.settings.save_setting("last_playlist_is_url", str(is_url).lower())
 
-            logger.info(f"Loaded playlist with {len(self.playlist.channels)} channels")
+            logger.info("Loaded playlist with %d channels", len(self.playlist.channels))
             self._update_ui()
             
             # Emit the playlist_loaded signal
@@ -111,13 +95,59 @@ class PlaylistController(QObject):
             logger.error(error_msg)
             self.window.show_notification(error_msg, NotificationType.ERROR)
             return False
-        finally:
-            if tmp_path and os.path.exists(tmp_path):
-                try:
-                    os.unlink(tmp_path)
-                    logger.debug(f"Temporary file removed: {tmp_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to remove temporary file: {str(e)}")
+
+    def _fetch_cached_playlist(self, url: str, max_retries: int = 3) -> Path:
+        """Download a URL playlist into its cache file, revalidating any cached copy.
+
+        Args:
+            url: The playlist URL.
+            max_retries: Maximum number of attempts when the download times out.
+
+        Returns:
+            Path: The cache file holding the current playlist.
+
+        Raises:
+            TimeoutError: If every attempt timed out.
+            RuntimeError: If the download failed for any other reason.
+        """
+        # Keep a local copy per URL and revalidate it on each load
+        cache_path = playlist_cache_path(url)
+        validators_key = f"playlist_cache:{cache_key(url)}"
+        validators = self.settings.get_setting(validators_key, "")
+        etag, _, last_modified = validators.partition("\n")
+
+        # Download playlist from URL with retry logic
+        logger.info("Downloading playlist from URL: %s", url)
+
+        for attempt in range(max_retries):
+            try:
+                logger.debug("Download attempt %d/%d", attempt + 1, max_retries)
+                etag, last_modified = download_to_cache(
+                    url, cache_path, etag, last_modified, timeout=30
+                )
+                break
+            except Timeout:
+                if attempt < max_retries - 1:
+                    logger.warning(
+                        "Timeout downloading playlist, retrying (%d/%d)",
+                        attempt + 1,
+                        max_retries,
+                    )
+                    continue
+                else:
+                    logger.error(
+                        "Failed to download playlist after %d attempts",
+                        max_retries,
+                    )
+                    raise TimeoutError(f"Timed out downloading playlist after {max_retries} attempts")
+            except RequestException as e:
+                logger.error("Request error: %s", e)
+                raise RuntimeError(f"Error downloading playlist: {str(e)}")
+
+        if f"{etag}\n{last_modified}" != validators:
+            self.settings.save_setting(validators_key, f"{etag}\n{last_modified}")
+
+        return cache_path
 
     def _update_ui(self):
         """Update UI elements after playlist changes."""
@@ -133,7 +163,6 @@ class PlaylistController(QObject):
     def _update_channel_list(self):
         """Update channel list based on selected category."""
         category = self.window.category_combo.currentText()
-        self.window.channel_list.clear()
 
         channels = (
             self.playlist.channels
@@ -141,8 +170,7 @@ class PlaylistController(QObject):
             else self.playlist.get_channels_by_category(category)
         )
 
-        for channel in channels:
-            self.window.channel_list.addItem(channel.name)
+        self.window.channel_list.model().set_channels(channels)
 
     def refresh_channels(self):
         """Update the channel list display based on current category and filters."""
@@ -55,23 +55,23 @@ class SettingsController:
         """Ensure all default settings exist in the database."""
         for key, value in self.DEFAULT_SETTINGS.items():
             if not self.db.get_setting(key):
-                logger.debug(f"Setting default value for {key}: {value}")
+                logger.debug("Setting default value for %s: %s", key, value)
                 self.db.save_setting(key, value)
 
     def _ensure_data_dir(self):
         """Ensure the data directory exists."""
         data_dir = Path.home() / ".simple_iptv" / "data"
         data_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Ensured data directory exists: {data_dir}")
+        logger.debug("Ensured data directory exists: %s", data_dir)
         
         # Create subdirectories
         cache_dir = data_dir / "cache"
         cache_dir.mkdir(exist_ok=True)
-        logger.debug(f"Ensured cache directory exists: {cache_dir}")
+        logger.debug("Ensured cache directory exists: %s", cache_dir)
         
         log_dir = Path.home() / ".simple_iptv" / "logs"
         log_dir.mkdir(exist_ok=True)
-        logger.debug(f"Ensured logs directory exists: {log_dir}")
+        logger.debug("Ensured logs directory exists: %s", log_dir)
 
     def _configure_logging(self):
         """Configure logging based on the debug setting."""
@@ -85,7 +85,7 @@ class SettingsController:
         for handler in root_logger.handlers:
             handler.setLevel(log_level)
             
-        logger.debug(f"Logging configured with level: {log_level}")
+        logger.debug("Logging configured with level: %s", log_level)
 
     def save_setting(self, key: str, value: str):
         """Save a setting value.
@@ -100,7 +100,16 @@ class SettingsController:
         if key == "enable_debug_logging":
             self._configure_logging()
             
-        logger.debug(f"Saved setting {key}: {value}")
+        logger.debug("Saved setting %s: %s", key, value)
+
+    def delete_setting(self, key: str):
+        """Delete a setting value.
+
+        Args:
+            key: The setting key.
+        """
+        self.db.delete_setting(key)
+        logger.debug("Deleted setting %s", key)
 
     def get_setting(self, key: str, default: str = None) -> str:
         """Get a setting value.
@@ -156,7 +165,12 @@ class SettingsController:
         try:
             return int(value)
         except ValueError:
-            logger.warning(f"Invalid integer setting for {key}: {value}, using default: {default}")
+            logger.warning(
+                "Invalid integer setting for %s: %s, using default: %s",
+                key,
+                value,
+                default,
+            )
             return default or 0
 
     def reset_to_defaults(self, keys: list = None):
@@ -172,7 +186,7 @@ class SettingsController:
             if key in self.DEFAULT_SETTINGS:
                 self.save_setting(key, self.DEFAULT_SETTINGS[key])
                 
-        logger.info(f"Reset settings to defaults: {keys}")
+        logger.info("Reset settings to defaults: %s", keys)
 
     def export_settings(self, file_path: str) -> bool:
         """Export all settings to a file.
@@ -192,10 +206,10 @@ class SettingsController:
                 for key, value in settings.items():
                     f.write(f"{key}={value}\n")
                     
-            logger.info(f"Exported settings to {file_path}")
+            logger.info("Exported settings to %s", file_path)
             return True
         except Exception as e:
-            logger.error(f"Failed to export settings: {e}")
+            logger.error("Failed to export settings: %s", e)
             return False
 
     def import_settings(self, file_path: str) -> bool:
@@ -216,11 +230,11 @@ class SettingsController:
                         if key in self.DEFAULT_SETTINGS:
                             self.save_setting(key, value)
                             
-            logger.info(f"Imported settings from {file_path}")
+            logger.info("Imported settings from %s", file_path)
             self._configure_logging()  # Reconfigure logging in case it changed
             return True
         except Exception as e:
-            logger.error(f"Failed to import settings: {e}")
+            logger.error("Failed to import settings: %s", e)
             return False
 
     def clear_setting(self, key: str):
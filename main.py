@@ -6,9 +6,10 @@ import sys
 import logging
 
 # pylint: disable=no-name-in-module
-from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtWidgets import QApplication
+from utils.themes import Themes
 from views.main_window import MainWindow
-from views.vlc_manager import VLCManager
+from views.vlc_manager import VLCLoader, VLCManager
 from controllers.player_controller import PlayerController
 
 
@@ -22,17 +23,22 @@ logger = logging.getLogger(__name__)
 def main():
     """Main application entry point."""
     logger.debug("Starting application")
+    # Xlib must be made thread-safe before Qt opens the display
+    VLCManager.init_xlib_threads()
     app = QApplication(sys.argv)
 
-    # Initialize VLC before creating any widgets
-    success, error = VLCManager.initialize()
-    if not success:
-        QMessageBox.critical(None, "Error", f"Failed to initialize VLC:\n{error}")
-        return 1
+    # Apply the theme once at application level so every window shares it
+    app.setStyleSheet(Themes.get_dark_theme())
 
     # Create main window and controller
     logger.debug("Creating main window")
     main_window = MainWindow()
+
+    # Load VLC in the background; the player is attached when it is ready
+    vlc_loader = VLCLoader()
+    vlc_loader.finished.connect(main_window.on_vlc_loaded)
+    vlc_loader.start()
+
     logger.debug("Creating player controller")
     player_controller = PlayerController(main_window)
     main_window.player_controller = player_controller
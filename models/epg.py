@@ -1,10 +1,12 @@
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import List, Dict, Optional
 from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Program:
     """Represents a TV program with its details."""
 
@@ -26,6 +28,37 @@ class EPGData:
 
     channel_id: str
     programs: List[Program]
+    _sorted: Optional[List[Program]] = field(default=None, init=False, repr=False)
+    _starts: List[datetime] = field(default_factory=list, init=False, repr=False)
+
+    def add(self, program: Program):
+        """Add a program and mark the start-time index for rebuilding.
+
+        Args:
+            program: The program to add.
+        """
+        self.programs.append(program)
+        self._sorted = None
+
+    def extend(self, programs: List[Program]):
+        """Add several programs and mark the start-time index for rebuilding.
+
+        Args:
+            programs: The programs to add.
+        """
+        self.programs.extend(programs)
+        self._sorted = None
+
+    def _start_index(self) -> List[Program]:
+        """Return the programs sorted by start time, rebuilding if needed.
+
+        The sorted copy and its start times are kept apart from ``programs``,
+        so lookups never reorder the list callers see.
+        """
+        if self._sorted is None or len(self._sorted) != len(self.programs):
+            self._sorted = sorted(self.programs, key=attrgetter("start_time"))
+            self._starts = [program.start_time for program in self._sorted]
+        return self._sorted
 
     def get_current_program(self, current_time: datetime = None) -> Optional[Program]:
         """Get the current program based on the provided time.
@@ -39,9 +72,10 @@ class EPGData:
         if current_time is None:
             current_time = datetime.now()
 
-        for program in self.programs:
-            if program.start_time <= current_time < program.end_time:
-                return program
+        programs = self._start_index()
+        index = bisect_right(self._starts, current_time) - 1
+        if index >= 0 and current_time < programs[index].end_time:
+            return programs[index]
         return None
 
     def get_upcoming_programs(self, current_time: datetime = None, limit: int = 5) -> List[Program]:
@@ -57,9 +91,9 @@ class EPGData:
         if current_time is None:
             current_time = datetime.now()
 
-        upcoming = [p for p in self.programs if p.start_time > current_time]
-        upcoming.sort(key=lambda p: p.start_time)
-        return upcoming[:limit]
+        programs = self._start_index()
+        index = bisect_right(self._starts, current_time)
+        return programs[index:index + limit]
 
 
 class EPG:
@@ -81,7 +115,7 @@ class EPG:
             self._channels[channel_id] = EPGData(channel_id=channel_id, programs=[])
         
         if programs:
-            self._channels[channel_id].programs.extend(programs)
+            self._channels[channel_id].extend(programs)
             self._programs_count += len(programs)
 
     def add_program(self, channel_id: str, program: Program):
@@ -94,7 +128,7 @@ class EPG:
         if channel_id not in self._channels:
             self.add_channel(channel_id)
             
-        self._channels[channel_id].programs.append(program)
+        self._channels[channel_id].add(program)
         self._programs_count += 1
 
     def get_channel_data(self, channel_id: str) -> Optional[EPGData]:
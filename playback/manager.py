@@ -2,12 +2,14 @@
 Manages the playback of channels in Picture-in-Picture mode.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtCore import QObject, pyqtSignal
 from views.vlc_manager import VLCManager
-from .pip_window import PiPWindow
+
+if TYPE_CHECKING:
+    from .pip_window import PiPWindow
 
 
 class PlaybackManager(QObject):
@@ -20,23 +22,26 @@ class PlaybackManager(QObject):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        # Ensure VLC is initialized
-        success, error = VLCManager.initialize()
-        if not success:
-            raise RuntimeError(f"Failed to initialize VLC: {error}")
-
-        self.pip_window: Optional[PiPWindow] = None
+        self.pip_window: Optional["PiPWindow"] = None
         self.main_window = parent
 
     def start_pip(self, channel_name: str, url: str):
         """Start Picture-in-Picture playback"""
         print(f"PlaybackManager: Starting PiP for {channel_name}")  # Debug
 
+        # VLC is loaded in the background and may not be ready yet
+        if not VLCManager.get_instance():
+            return
+
         # Pause the main player
         if self.main_window and self.main_window.player_controller:
             self.main_window.player_controller.window.player_widget.pause()
 
         if not self.pip_window:
+            # PiP is rarely used, so its window classes are only built on demand
+            # pylint: disable=import-outside-toplevel
+            from .pip_window import PiPWindow
+
             self.pip_window = PiPWindow()
             self.pip_window.stop_btn.clicked.connect(self.stop_pip)
 
@@ -2,10 +2,8 @@
 Picture-in-Picture window for VLC playback.
 """
 
-import sys
-
 # pylint: disable=no-name-in-module
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,42 +13,41 @@ from PyQt6.QtWidgets import (
     QFrame,
     QSizePolicy,
 )
+from views.player_widget import build_media
 from views.vlc_manager import VLCManager
-from utils.themes import Themes
 
 
 class FullscreenPiP(QWidget):
-    """Fullscreen window for PiP mode"""
+    """Fullscreen window for PiP mode.
+
+    The PiP window's native video container is moved into this window rather
+    than rebinding VLC to a new window handle, so libVLC keeps its video
+    surface across the switch.
+    """
+
+    # Emitted on close so the PiP window can take the video container back
+    closed = pyqtSignal()
 
     def __init__(self, pip_window):
         super().__init__()
         print("FullscreenPiP: Initializing")  # Debug
         self.pip_window = pip_window
-        self.player = pip_window.player
 
         # Make window fullscreen
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.FramelessWindowHint)
-        self.setStyleSheet("background-color: black;")
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
 
         # Enable mouse tracking
         self.setMouseTracking(True)
 
+        # Borrow the video container; the PiP window takes it back on close
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(pip_window.video_container)
+
         print("FullscreenPiP: Showing fullscreen")  # Debug
         self.showFullScreen()
 
-        # Update VLC rendering target
-        self._update_vlc_rendering_target()
-
-    def _update_vlc_rendering_target(self):
-        """Update VLC rendering target based on platform"""
-        print("FullscreenPiP: Updating VLC rendering target")  # Debug
-        if sys.platform == "win32":
-            self.player.set_hwnd(self.winId())
-        elif sys.platform.startswith("linux"):
-            self.player.set_xwindow(self.winId())
-        elif sys.platform == "darwin":
-            self.player.set_nsobject(int(self.winId()))
-
     def mouseDoubleClickEvent(self, event):
         """Handle double click to exit fullscreen"""
         print("FullscreenPiP: Double click detected")  # Debug
@@ -63,11 +60,10 @@ class FullscreenPiP(QWidget):
             print("FullscreenPiP: ESC key pressed")  # Debug
             self.close()
 
-    def resizeEvent(self, event):
-        """Handle resize to update VLC rendering target"""
-        super().resizeEvent(event)
-        print("FullscreenPiP: Resize event")  # Debug
-        self._update_vlc_rendering_target()
+    def closeEvent(self, event):
+        """Return the video container to the PiP window"""
+        self.closed.emit()
+        super().closeEvent(event)
 
 
 class PiPWindow(QFrame):
@@ -85,10 +81,6 @@ class PiPWindow(QFrame):
         self.old_pos = None
         self.dragging = False
         self.player = None
-        self.instance = None
-
-        # Apply theme
-        self.setStyleSheet(Themes.get_dark_theme())
 
         self.setup_ui()
         self.setup_player()
@@ -109,9 +101,6 @@ class PiPWindow(QFrame):
             self.player.stop()
             self.player.release()
             self.player = None
-        if hasattr(self, "instance") and self.instance:
-            self.instance.release()
-            self.instance = None
 
     def closeEvent(self, event):
         """Handle window close event"""
@@ -126,77 +115,29 @@ class PiPWindow(QFrame):
 
         # Title bar with drag handle
         title_bar = QWidget()
-        title_bar.setStyleSheet(
-            """
-            QWidget {
-                background-color: #2d2d2d;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-        """
-        )
+        title_bar.setObjectName("PiPTitleBar")
         title_bar.setCursor(Qt.CursorShape.SizeAllCursor)  # Show move cursor
         title_layout = QHBoxLayout(title_bar)
         title_layout.setContentsMargins(4, 4, 4, 4)
 
         # Add a label to show it's draggable
         drag_label = QPushButton("⋮⋮")  # Vertical dots to indicate draggable
-        drag_label.setStyleSheet(
-            """
-            QPushButton {
-                background: transparent;
-                border: none;
-                color: #808080;
-                font-size: 16px;
-                padding: 2px 8px;
-            }
-            QPushButton:hover {
-                color: #ffffff;
-            }
-        """
-        )
+        drag_label.setObjectName("PiPDragHandle")
         title_layout.addWidget(drag_label)
         title_layout.addStretch()
 
         # Video container with dark background
         self.video_container = QWidget()
-        self.video_container.setStyleSheet(
-            """
-            QWidget {
-                background-color: #000000;
-                border: none;
-            }
-        """
-        )
+        self.video_container.setObjectName("PiPVideo")
         self.video_container.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
+        # Give the container its own native window so VLC can render into it
+        self.video_container.setAttribute(Qt.WidgetAttribute.WA_NativeWindow, True)
 
         # Controls container
         controls_container = QWidget()
-        controls_container.setStyleSheet(
-            """
-            QWidget {
-                background-color: #2d2d2d;
-                border-bottom-left-radius: 4px;
-                border-bottom-right-radius: 4px;
-            }
-            QPushButton {
-                min-width: 60px;
-                padding: 4px 8px;
-                background-color: #3d3d3d;
-                border: none;
-                border-radius: 2px;
-                color: #ffffff;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """
-        )
+        controls_container.setObjectName("PiPControls")
 
         self.controls_layout = QHBoxLayout(controls_container)
         self.controls_layout.setContentsMargins(4, 4, 4, 4)
@@ -212,52 +153,50 @@ class PiPWindow(QFrame):
 
         # Size grip
         self.size_grip = QSizeGrip(self)
-        self.size_grip.setStyleSheet(
-            """
-            QSizeGrip {
-                background-color: #2d2d2d;
-                width: 16px;
-                height: 16px;
-            }
-        """
-        )
+        self.size_grip.setObjectName("PiPSizeGrip")
         self.controls_layout.addWidget(self.size_grip)
 
         # Add all components to main layout
         main_layout.addWidget(title_bar)
         main_layout.addWidget(self.video_container, 1)
         main_layout.addWidget(controls_container)
-
-        # Set overall window style
-        self.setStyleSheet(
-            self.styleSheet()
-            + """
-            PiPWindow {
-                background-color: #1a1a1a;
-                border: 1px solid #404040;
-                border-radius: 4px;
-            }
-        """
-        )
+        self.main_layout = main_layout
+
+        # Take the handle only now that the container is parented, so Qt
+        # doesn't create it as a top-level window first. Qt may still replace
+        # it later, which the event filter picks up
+        self._native_winid = int(self.video_container.winId())
+        self.video_container.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """Rebind VLC when the video container's native window changes"""
+        if obj is self.video_container and event.type() == QEvent.Type.WinIdChange:
+            self._native_winid = int(self.video_container.winId())
+            if self.player:
+                VLCManager.set_output_window(self.player, self._native_winid)
+        return super().eventFilter(obj, event)
 
     def setup_player(self):
         print("PiPWindow: Setting up player")  # Debug
-        vlc = VLCManager._vlc
-        print(f"PiPWindow: VLC instance: {vlc}")  # Debug
-        if vlc:
-            self.instance = vlc.Instance()
-            self.player = self.instance.media_player_new()
+        # Share the app's VLC instance so PiP gets the same decoder and
+        # output settings as the main player
+        instance = VLCManager.get_instance()
+        print(f"PiPWindow: VLC instance: {instance}")  # Debug
+        if instance:
+            self.player = VLCManager.create_player()
 
-            if self.video_container.winId():
-                print(f"PiPWindow: Window ID: {self.video_container.winId()}")  # Debug
-                self.player.set_hwnd(self.video_container.winId())
+            if self._native_winid:
+                print(f"PiPWindow: Window ID: {self._native_winid}")  # Debug
+                VLCManager.set_output_window(self.player, self._native_winid)
 
     def play(self, url):
         print(f"PiPWindow: Attempting to play {url}")  # Debug
-        if hasattr(self, "player"):
+        if self.player:
             print("PiPWindow: Player exists, creating media")  # Debug
-            media = self.instance.media_new(url)
+            media = build_media(VLCManager.get_instance(), url)
             self.player.set_media(media)
+            # The player keeps its own reference to the media
+            media.release()
             self.player.play()
         else:
             print("PiPWindow: No player available!")  # Debug
@@ -300,7 +239,7 @@ class PiPWindow(QFrame):
         if not self.fullscreen_window:
             print("PiPWindow: Creating fullscreen window")  # Debug
             self.fullscreen_window = FullscreenPiP(self)
-            self.fullscreen_window.destroyed.connect(self._on_fullscreen_closed)
+            self.fullscreen_window.closed.connect(self._on_fullscreen_closed)
         else:
             print("PiPWindow: Exiting fullscreen")  # Debug
             self._exit_fullscreen()
@@ -309,22 +248,16 @@ class PiPWindow(QFrame):
         """Exit fullscreen mode and restore video to PiP window"""
         print("PiPWindow: Executing _exit_fullscreen")  # Debug
         if self.fullscreen_window:
-            print("PiPWindow: Restoring video to PiP window")  # Debug
-            # Restore video to PiP window
-            if sys.platform == "win32":
-                self.player.set_hwnd(self.video_container.winId())
-            elif sys.platform.startswith("linux"):
-                self.player.set_xwindow(self.video_container.winId())
-            elif sys.platform == "darwin":
-                self.player.set_nsobject(int(self.video_container.winId()))
-
             print("PiPWindow: Closing fullscreen window")  # Debug
+            # The fullscreen window hands the video back from its closeEvent
             self.fullscreen_window.close()
-            self.fullscreen_window = None
 
     def _on_fullscreen_closed(self):
         """Callback for when the fullscreen window is closed"""
-        self._exit_fullscreen()
+        print("PiPWindow: Restoring video to PiP window")  # Debug
+        # Same native window, so VLC keeps rendering without a rebind
+        self.main_layout.insertWidget(1, self.video_container, 1)
+        self.fullscreen_window = None
 
     def keyPressEvent(self, event):
         """Handle ESC key to exit fullscreen"""
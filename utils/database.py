@@ -3,13 +3,81 @@ This module provides utilities for managing the database.
 It defines the Database class, which can handle database operations.
 """
 
+import logging
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 from models.playlist import Channel
 from models.epg import Program
 
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Bump whenever init_database's schema setup changes so existing databases rerun it
+SCHEMA_VERSION = 1
+
+# Hot lookup queries are kept as constants so sqlite3's statement cache
+# keys on the same string object and skips re-preparing them.
+SQL_GET_FAVORITE_URLS = "SELECT url FROM favorites"
+SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+SQL_CURRENT_PROGRAM = """
+    SELECT title, start_time, end_time, description FROM epg_data
+    WHERE channel_id = ?
+    AND start_time <= ?
+    AND end_time > ?
+    LIMIT 1
+"""
+SQL_UPCOMING_PROGRAMS = """
+    SELECT title, start_time, end_time, description FROM epg_data
+    WHERE channel_id = ?
+    AND end_time > ?
+    ORDER BY start_time
+    LIMIT ?
+"""
+SQL_ADD_FAVORITE = """
+    INSERT INTO favorites
+    (name, url, group_name, logo)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT (url) DO UPDATE SET
+        name = excluded.name,
+        group_name = excluded.group_name,
+        logo = excluded.logo
+    WHERE name IS NOT excluded.name
+        OR group_name IS NOT excluded.group_name
+        OR logo IS NOT excluded.logo
+"""
+SQL_REMOVE_FAVORITE = "DELETE FROM favorites WHERE url = ?"
+SQL_SAVE_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+SQL_DELETE_SETTING = "DELETE FROM settings WHERE key = ?"
+SQL_UPSERT_PLAYLIST = """
+    INSERT INTO playlists (name, path, is_url) VALUES (?, ?, ?)
+    ON CONFLICT (path, is_url) DO UPDATE SET name = excluded.name
+"""
+SQL_DELETE_PLAYLIST = "DELETE FROM playlists WHERE id = ?"
+SQL_GET_PLAYLISTS = "SELECT name, path, is_url FROM playlists"
+SQL_GET_PLAYLIST_ROWS = "SELECT id, name, path, is_url FROM playlists"
+# start_time trails end_time so the current-program filter is answered from
+# the index before any table row is read
+SQL_CREATE_EPG_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_epg_ch_end_start
+        ON epg_data (channel_id, end_time, start_time)
+"""
+SQL_INSERT_EPG = """
+    INSERT OR REPLACE INTO epg_data
+    (channel_id, start_time, end_time, title, description)
+    VALUES (?, ?, ?, ?, ?)
+"""
+# Columns in Channel field order so rows unpack straight into Channel(*row)
+SQL_GET_FAVORITES = """
+    SELECT name, url, COALESCE(group_name, ''), COALESCE(logo, ''),
+           COALESCE(epg_id, ''), 0, 0, id
+    FROM favorites
+"""
+
 
 class Database:
     """Handles database operations for the Simple IPTV Player."""
@@ -18,37 +86,112 @@ class Database:
         """Initialize the database connection and create necessary tables."""
         self.db_path = Path.home() / ".simple_iptv" / "database.db"
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        print(f"Database path: {self.db_path}")
+        logger.debug("Database path: %s", self.db_path)
+        # One writer connection, serialized by the lock, plus one read-only
+        # connection per thread; under WAL readers never wait on the writer
         self._connection = None
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._read_connections = []
+
+        # Favorite URLs rarely change, so is_favorite answers from this set;
+        # writes to favorites reset it to None under the lock
+        self._favorite_urls = None
+
+        # Settings are served from memory too. Writers bump the generation
+        # after committing, and a reader only caches what it fetched if no
+        # write finished in the meantime
+        self._settings = {}
+        self._cache_generation = 0
         self.init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with the per-connection settings applied."""
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256
+        )  # Ensure path is string
+
+        # These settings are per-connection, so apply them whenever a
+        # connection is opened rather than only during init_database
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
     def _get_connection(self):
-        """Get a new connection if none exists."""
+        """Get the shared write connection, creating it if none exists."""
         if self._connection is None:
-            self._connection = sqlite3.connect(
-                str(self.db_path)
-            )  # Ensure path is string
-            self._connection.row_factory = sqlite3.Row
+            self._connection = self._connect()
         return self._connection
 
+    def _get_read_connection(self):
+        """Get the calling thread's read-only connection, creating it if none exists."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only=1")
+            self._local.connection = conn
+            with self._lock:
+                self._read_connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _write_transaction(self):
+        """Run a write transaction on the shared write connection.
+
+        The write lock is held throughout, and BEGIN IMMEDIATE takes SQLite's
+        write lock up front, so the transaction waits (up to busy_timeout)
+        before doing any work instead of failing with SQLITE_BUSY halfway.
+
+        Yields:
+            sqlite3.Connection: The write connection, inside an open transaction.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
     def close(self):
-        """Close the database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the database connections."""
+        with self._lock:
+            for conn in self._read_connections:
+                conn.close()
+            self._read_connections = []
+            self._local = threading.local()
+
+            if self._connection:
+                try:
+                    self._connection.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                self._connection.close()
+                self._connection = None
 
     def init_database(self):
         """Initialize the database with required tables and settings."""
         conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
+            conn = self._get_connection()
+
+            # The schema setup only needs to run once per schema version, so
+            # warm starts skip it after a single header read
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return
 
-            # Enable WAL mode for better performance
+            # Larger pages suit the EPG range scans; this only takes effect on
+            # a fresh database and must run before WAL mode is enabled
+            conn.execute("PRAGMA page_size=8192")
+
+            # Enable WAL mode for better performance; this is stored in the
+            # database file, unlike the settings in _get_connection
             conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA cache_size=-2000")
-            conn.execute("PRAGMA temp_store=MEMORY")
 
             # Create tables
             conn.executescript(
@@ -95,28 +238,39 @@ class Database:
             """
             )
 
+            # Playlists are keyed by source so saves can upsert; drop any
+            # duplicates older versions may have stored before indexing,
+            # logging each one since the user may have named them differently
+            duplicates = conn.execute(
+                """SELECT id, name, path FROM playlists WHERE id NOT IN
+                   (SELECT MIN(id) FROM playlists GROUP BY path, is_url)"""
+            ).fetchall()
+            for _, name, path in duplicates:
+                logger.warning(
+                    "Removing duplicate playlist entry %r for %s", name, path
+                )
+            conn.executemany(
+                SQL_DELETE_PLAYLIST,
+                [(playlist_id,) for playlist_id, _, _ in duplicates],
+            )
+            conn.execute(
+                """CREATE UNIQUE INDEX IF NOT EXISTS idx_playlists_source
+                   ON playlists (path, is_url)"""
+            )
+
+            # Range index for current/upcoming program lookups; the older
+            # two-column index is superseded by it
+            conn.execute("DROP INDEX IF EXISTS idx_epg_ch_time")
+            conn.execute(SQL_CREATE_EPG_INDEX)
+
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
             conn.commit()
-            print("Database initialized successfully")
-
-            # Debug print table contents
-            cursor = conn.execute("SELECT COUNT(*) FROM playlists")
-            count = cursor.fetchone()[0]
-            print(f"Found {count} existing playlists in database")
-
-            if count > 0:
-                cursor = conn.execute("SELECT name, path, is_url FROM playlists")
-                for row in cursor:
-                    print(
-                        f"Existing playlist: {row['name']}, {row['path']}, {bool(row['is_url'])}"
-                    )
+            logger.debug("Database initialized successfully")
 
         except sqlite3.Error as e:
-            print(f"Error initializing database: {e}")
+            logger.error("Error initializing database: %s", e)
             if conn:
                 conn.rollback()
-        finally:
-            if conn:
-                conn.close()
 
     def add_favorite(self, channel: Channel) -> bool:
         """Add a channel to the favorites list.
@@ -128,16 +282,15 @@ class Database:
             bool: True if the operation was successful, False otherwise.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write_transaction() as conn:
+                self._favorite_urls = None
                 conn.execute(
-                    """INSERT OR REPLACE INTO favorites 
-                       (name, url, group_name, logo) 
-                       VALUES (?, ?, ?, ?)""",
+                    SQL_ADD_FAVORITE,
                     (channel.name, channel.url, channel.group, channel.logo),
                 )
                 return True
         except sqlite3.Error as e:
-            print(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
             return False
 
     def remove_favorite(self, url: str) -> bool:
@@ -150,8 +303,9 @@ class Database:
             bool: True if the operation was successful, False otherwise.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM favorites WHERE url = ?", (url,))
+            with self._write_transaction() as conn:
+                self._favorite_urls = None
+                conn.execute(SQL_REMOVE_FAVORITE, (url,))
             return True
         except sqlite3.Error:
             return False
@@ -163,12 +317,10 @@ class Database:
             List[Channel]: A list of favorite channels.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("SELECT * FROM favorites")
-                return [Channel.from_db_row(row) for row in cursor.fetchall()]
+            cursor = self._get_read_connection().execute(SQL_GET_FAVORITES)
+            return [Channel(*row) for row in cursor]
         except sqlite3.Error as e:
-            print(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
             return []
 
     def is_favorite(self, url: str) -> bool:
@@ -180,12 +332,18 @@ class Database:
         Returns:
             bool: True if the channel is a favorite, False otherwise.
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("SELECT 1 FROM favorites WHERE url = ?", (url,))
-                return cursor.fetchone() is not None
-        except sqlite3.Error:
-            return False
+        favorite_urls = self._favorite_urls
+        if favorite_urls is None:
+            try:
+                # Built under the lock so a concurrent write can't leave a stale set
+                with self._lock:
+                    cursor = self._get_read_connection().execute(SQL_GET_FAVORITE_URLS)
+                    favorite_urls = self._favorite_urls = frozenset(
+                        row[0] for row in cursor
+                    )
+            except sqlite3.Error:
+                return False
+        return url in favorite_urls
 
     def save_setting(self, key: str, value: str):
         """Save a setting key-value pair to the database.
@@ -195,13 +353,28 @@ class Database:
             value (str): The setting value.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-                    (key, value),
-                )
+            with self._lock:
+                with self._write_transaction() as conn:
+                    conn.execute(SQL_SAVE_SETTING, (key, value))
+                self._settings[key] = value
+                self._cache_generation += 1
         except sqlite3.Error:
-            pass
+            self._settings.pop(key, None)
+
+    def delete_setting(self, key: str):
+        """Delete a setting by its key.
+
+        Args:
+            key (str): The setting key.
+        """
+        try:
+            with self._lock:
+                with self._write_transaction() as conn:
+                    conn.execute(SQL_DELETE_SETTING, (key,))
+                self._settings[key] = None
+                self._cache_generation += 1
+        except sqlite3.Error:
+            self._settings.pop(key, None)
 
     def get_setting(self, key: str, default: str = "") -> str:
         """Retrieve a setting value by its key.
@@ -213,16 +386,22 @@ class Database:
         Returns:
             str: The setting value.
         """
+        if key in self._settings:
+            value = self._settings[key]
+            return default if value is None else value
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT value FROM settings WHERE key = ?", (key,)
-                )
-                result = cursor.fetchone()
-                return result[0] if result else default
+            generation = self._cache_generation
+            cursor = self._get_read_connection().execute(SQL_GET_SETTING, (key,))
+            result = cursor.fetchone()
         except sqlite3.Error:
             return default
 
+        value = result[0] if result else None
+        if generation == self._cache_generation:
+            self._settings[key] = value
+        return default if value is None else value
+
     def save_epg_program(self, channel_id: str, program: Program):
         """Save an EPG program to the database.
 
@@ -231,13 +410,9 @@ class Database:
             program (Program): The EPG program to save.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write_transaction() as conn:
                 conn.execute(
-                    """
-                    INSERT OR REPLACE INTO epg_data 
-                    (channel_id, start_time, end_time, title, description)
-                    VALUES (?, ?, ?, ?, ?)
-                """,
+                    SQL_INSERT_EPG,
                     (
                         channel_id,
                         int(program.start_time.timestamp()),
@@ -260,30 +435,24 @@ class Database:
             Optional[Program]: The current EPG program if found, otherwise None.
         """
         try:
-            current_time = int(datetime.now().timestamp())
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM epg_data 
-                    WHERE channel_id = ? 
-                    AND start_time <= ? 
-                    AND end_time > ?
-                """,
-                    (channel_id, current_time, current_time),
-                )
-
-                row = cursor.fetchone()
-                if row:
-                    return Program(
-                        title=row["title"],
-                        start_time=datetime.fromtimestamp(row["start_time"]),
-                        end_time=datetime.fromtimestamp(row["end_time"]),
-                        description=row["description"],
-                    )
-            return None
+            current_time = int(time.time())
+            cursor = self._get_read_connection().execute(
+                SQL_CURRENT_PROGRAM, (channel_id, current_time, current_time)
+            )
+            row = cursor.fetchone()
         except sqlite3.Error:
             return None
 
+        if not row:
+            return None
+        title, start_time, end_time, description = row
+        return Program(
+            title=title,
+            start_time=datetime.fromtimestamp(start_time),
+            end_time=datetime.fromtimestamp(end_time),
+            description=description,
+        )
+
     def get_upcoming_programs(self, channel_id: str, limit: int = 5) -> List[Program]:
         """Retrieve upcoming EPG programs for a channel.
 
@@ -295,121 +464,89 @@ class Database:
             List[Program]: A list of upcoming EPG programs.
         """
         try:
-            current_time = int(datetime.now().timestamp())
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM epg_data 
-                    WHERE channel_id = ? 
-                    AND end_time > ?
-                    ORDER BY start_time
-                    LIMIT ?
-                """,
-                    (channel_id, current_time, limit),
-                )
+            current_time = int(time.time())
+            cursor = self._get_read_connection().execute(
+                SQL_UPCOMING_PROGRAMS, (channel_id, current_time, limit)
+            )
 
-                return [
-                    Program(
-                        title=row["title"],
-                        start_time=datetime.fromtimestamp(row["start_time"]),
-                        end_time=datetime.fromtimestamp(row["end_time"]),
-                        description=row["description"],
-                    )
-                    for row in cursor.fetchall()
-                ]
+            return [
+                Program(
+                    title=title,
+                    start_time=datetime.fromtimestamp(start_time),
+                    end_time=datetime.fromtimestamp(end_time),
+                    description=description,
+                )
+                for title, start_time, end_time, description in cursor
+            ]
         except sqlite3.Error:
             return []
 
     def save_playlists(self, playlists):
         """Save a list of playlists to the database.
 
+        Only the difference from the stored list is written: playlists that
+        are gone are deleted, and new or renamed ones are upserted by source.
+
         Args:
             playlists (list): A list of (name, path, is_url) tuples representing playlists.
+
+        Returns:
+            bool: True if the operation was successful, False otherwise.
         """
-        conn = None
+        wanted = {(path, 1 if is_url else 0): name for name, path, is_url in playlists}
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
-
-            # Start transaction
-            conn.execute("BEGIN")
-
-            # Debug print current playlists before deletion
-            cursor = conn.execute("SELECT COUNT(*) FROM playlists")
-            count = cursor.fetchone()[0]
-            print(f"Current playlists in DB before deletion: {count}")
-
-            # Clear existing playlists
-            conn.execute("DELETE FROM playlists")
-
-            # Insert new playlists
-            for name, path, is_url in playlists:
-                print(f"Saving playlist: {name}, {path}, {is_url}")  # Debug print
-                conn.execute(
-                    "INSERT INTO playlists (name, path, is_url) VALUES (?, ?, ?)",
-                    (name, path, 1 if is_url else 0),
+            with self._write_transaction() as conn:
+                stored = {
+                    (path, is_url): (playlist_id, name)
+                    for playlist_id, name, path, is_url in conn.execute(
+                        SQL_GET_PLAYLIST_ROWS
+                    )
+                }
+
+                # Remove playlists that are no longer in the list
+                conn.executemany(
+                    SQL_DELETE_PLAYLIST,
+                    [
+                        (playlist_id,)
+                        for key, (playlist_id, _) in stored.items()
+                        if key not in wanted
+                    ],
                 )
 
-            # Commit changes
-            conn.commit()
-
-            # Verify the save
-            cursor = conn.execute("SELECT COUNT(*) FROM playlists")
-            count = cursor.fetchone()[0]
-            print(f"Playlists in DB after save: {count}")
-
+                # Insert new playlists and rename changed ones
+                conn.executemany(
+                    SQL_UPSERT_PLAYLIST,
+                    [
+                        (name, path, is_url)
+                        for (path, is_url), name in wanted.items()
+                        if stored.get((path, is_url), (None, None))[1] != name
+                    ],
+                )
             return True
 
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
-            print(f"Error saving playlists: {e}")
+            logger.error("Error saving playlists: %s", e)
             return False
 
-        finally:
-            if conn:
-                conn.close()
-
     def get_playlists(self):
         """Retrieve the list of playlists from the database.
 
         Returns:
             list: A list of (name, path, is_url) tuples representing playlists.
         """
-        conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
-
-            # Debug print table info
-            cursor = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='playlists'"
-            )
-            if not cursor.fetchone():
-                print("Playlists table does not exist!")
-                return []
-
-            cursor = conn.execute("SELECT name, path, is_url FROM playlists")
-            rows = cursor.fetchall()
+            cursor = self._get_read_connection().execute(SQL_GET_PLAYLISTS)
             playlists = [
-                (row["name"], row["path"], bool(row["is_url"])) for row in rows
+                (name, path, bool(is_url)) for name, path, is_url in cursor
             ]
 
-            print(f"Loaded {len(playlists)} playlists from database")
-            for name, path, is_url in playlists:
-                print(f"Loaded playlist: {name}, {path}, {is_url}")  # Debug print
-
+            logger.debug("Loaded %d playlists from database", len(playlists))
             return playlists
 
         except sqlite3.Error as e:
-            print(f"Error loading playlists: {e}")
+            logger.error("Error loading playlists: %s", e)
             return []
 
-        finally:
-            if conn:
-                conn.close()
-
     def clear_setting(self, key: str):
         """Clear a setting from the database."""
         self.save_setting(key, "")
@@ -0,0 +1,141 @@
+"""
+This module provides helpers for downloading remote playlists.
+
+Each thread keeps its own requests.Session, so repeated requests to the same
+provider reuse pooled connections instead of reconnecting each time, without
+sharing a session between the GUI thread and the pool workers.
+URL playlists can also be kept in a local cache and revalidated with a
+conditional GET, so an unchanged playlist is not downloaded again.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Tuple
+import requests
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Size of the blocks streamed from the response to disk
+_CHUNK_SIZE = 1 << 16
+
+# Downloaded URL playlists are kept here between sessions
+PLAYLIST_CACHE_DIR = Path.home() / ".simple_iptv" / "data" / "cache" / "playlists"
+
+_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Get the calling thread's session, creating it if none exists."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
+
+def cache_key(url: str) -> str:
+    """Return a short, filesystem-safe key identifying a URL.
+
+    Args:
+        url: The URL to key.
+
+    Returns:
+        str: A hex digest of the URL.
+    """
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+def playlist_cache_path(url: str) -> Path:
+    """Return where the cached copy of a URL playlist is kept.
+
+    Args:
+        url: The playlist URL.
+
+    Returns:
+        Path: The cache file for the URL.
+    """
+    return PLAYLIST_CACHE_DIR / f"{cache_key(url)}.m3u8"
+
+
+def _write_body(response: requests.Response, file) -> None:
+    """Stream a response body into an open binary file."""
+    for chunk in response.iter_content(_CHUNK_SIZE):
+        file.write(chunk)
+
+
+def download_to_cache(
+    url: str,
+    cache_path: Path,
+    etag: str = "",
+    last_modified: str = "",
+    timeout: int = 30,
+) -> Tuple[str, str]:
+    """Download a URL into a cache file, revalidating any existing copy.
+
+    If the cache file exists, the validators from the previous download are
+    sent as a conditional GET and a 304 reply keeps the cached copy without
+    transferring the body again. A new body replaces the file atomically, so
+    a failed download never leaves a truncated copy behind.
+
+    Args:
+        url: The URL to download.
+        cache_path: Where the cached copy lives.
+        etag: ETag returned by the previous download, if any.
+        last_modified: Last-Modified returned by the previous download, if any.
+        timeout: Connect/read timeout in seconds.
+
+    Returns:
+        Tuple[str, str]: The (etag, last_modified) validators of the cached copy.
+
+    Raises:
+        requests.RequestException: If the request fails or returns an error status.
+    """
+    headers = {}
+    if cache_path.exists():
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    with _get_session().get(url, headers=headers, timeout=timeout, stream=True) as response:
+        if response.status_code == 304 and headers:
+            logger.debug("Cached copy of %s is current", url)
+            return etag, last_modified
+        response.raise_for_status()
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = cache_path.with_name(cache_path.name + ".part")
+        try:
+            with open(part_path, "wb") as part_file:
+                _write_body(response, part_file)
+            os.replace(part_path, cache_path)
+        except BaseException:
+            if part_path.exists():
+                part_path.unlink()
+            raise
+
+        logger.debug("Downloaded %s to %s", url, cache_path)
+        return (
+            response.headers.get("ETag", ""),
+            response.headers.get("Last-Modified", ""),
+        )
+
+
+def check_url(url: str, timeout: int = 30) -> None:
+    """Check that a URL can be downloaded, without fetching its body.
+
+    Only the status line and headers are read; the connection is closed
+    before any of the body is transferred.
+
+    Args:
+        url: The URL to check.
+        timeout: Connect/read timeout in seconds.
+
+    Raises:
+        requests.RequestException: If the request fails or returns an error status.
+    """
+    with _get_session().get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
@@ -6,6 +6,8 @@ import os
 import logging
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from functools import lru_cache
+from typing import Iterator, Tuple
 from models.epg import Program, EPGData, EPGGuide, EPG
 
 # Configure logger
@@ -28,12 +30,36 @@ class EPGParser:
         Raises:
             ValueError: If the date string is in an unsupported format.
         """
+        return EPGParser._parse_date_cached(date_str)
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _parse_date_cached(date_str: str) -> datetime:
+        """Memoized implementation of parse_date.
+
+        XMLTV files repeat the same start/stop stamps across channels and
+        back-to-back programs, so most lookups are cache hits.
+        """
         # Add timezone handling
         date_str = date_str.split("+")[0].split("-")[0]
 
         # Remove any spaces or 'T'
         date_str = date_str.replace(" ", "").replace("T", "")
 
+        # Fast path: slice YYYYMMDDHHMM[SS] directly instead of using strptime
+        if date_str.isdigit() and len(date_str) in (12, 14):
+            try:
+                return datetime(
+                    int(date_str[0:4]),
+                    int(date_str[4:6]),
+                    int(date_str[6:8]),
+                    int(date_str[8:10]),
+                    int(date_str[10:12]),
+                    int(date_str[12:14]) if len(date_str) == 14 else 0,
+                )
+            except ValueError as exc:
+                raise ValueError(f"Unsupported date format: {date_str}") from exc
+
         # Parse YYYYMMDDHHMMSS format
         try:
             return datetime.strptime(date_str, "%Y%m%d%H%M%S")
@@ -44,6 +70,65 @@ class EPGParser:
             except ValueError as exc:
                 raise ValueError(f"Unsupported date format: {date_str}") from exc
 
+    @staticmethod
+    def _iter_programs(file_path: str) -> Iterator[Tuple[str, Program]]:
+        """Stream (channel_id, Program) pairs from an XMLTV file.
+
+        Elements are cleared from the tree as soon as they are processed, so
+        memory use stays flat regardless of the file size.
+
+        Args:
+            file_path (str): The path to the XMLTV file.
+
+        Yields:
+            Tuple[str, Program]: The channel ID and the parsed program.
+
+        Raises:
+            ValueError: If the file has no root element or it is not 'tv'.
+        """
+        context = ET.iterparse(file_path, events=("start", "end"))
+        first = next(context, None)
+        if first is None:
+            raise ValueError("Invalid XMLTV format: no root element")
+        _, root = first
+        if root.tag != "tv":
+            raise ValueError("Invalid XMLTV format: missing root 'tv' element")
+
+        for event, program in context:
+            if event != "end" or program.tag != "programme":
+                continue
+
+            attrib = program.attrib
+            channel_id = attrib.get("channel")
+            if not channel_id:
+                root.clear()
+                continue
+
+            # Parse program data with new date parser
+            try:
+                start_time = EPGParser.parse_date(attrib.get("start", ""))
+                end_time = EPGParser.parse_date(attrib.get("stop", ""))
+            except ValueError as e:
+                logger.warning("Skipping program due to invalid date: %s", e)
+                root.clear()
+                continue
+
+            # Collect the first text of each child tag in a single pass
+            texts = {}
+            for child in program:
+                texts.setdefault(child.tag, child.text)
+
+            # Drop processed elements so the tree never grows
+            root.clear()
+
+            yield channel_id, Program(
+                title=texts.get("title", "No Title"),
+                start_time=start_time,
+                end_time=end_time,
+                description=texts.get("desc", ""),
+                category=texts.get("category", ""),
+            )
+
     @staticmethod
     def parse(file_path: str) -> EPG:
         """Parse an XMLTV file and return an EPG object.
@@ -65,59 +150,26 @@ class EPGParser:
             raise ValueError("EPG file is empty")
 
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
-            if root.tag != "tv":
-                raise ValueError("Invalid XMLTV format: missing root 'tv' element")
-
             epg = EPG()
             channel_count = 0
             program_count = 0
 
-            for program in root.findall(".//programme"):
-                channel_id = program.get("channel")
-                if not channel_id:
-                    continue
-
-                # Parse program data with new date parser
-                try:
-                    start_time = EPGParser.parse_date(program.get("start", ""))
-                    end_time = EPGParser.parse_date(program.get("stop", ""))
-                except ValueError as e:
-                    logger.warning(f"Skipping program due to invalid date: {e}")
-                    continue
-
-                title = program.find("title")
-                title_text = title.text if title is not None else "No Title"
-
-                desc = program.find("desc")
-                desc_text = desc.text if desc is not None else ""
-
-                category = program.find("category")
-                category_text = category.text if category is not None else ""
-
-                prog = Program(
-                    title=title_text,
-                    start_time=start_time,
-                    end_time=end_time,
-                    description=desc_text,
-                    category=category_text,
-                )
+            for channel_id, prog in EPGParser._iter_programs(file_path):
+                # Create a channel if needed
+                if epg.get_channel_data(channel_id) is None:
+                    channel_count += 1
 
                 # Add to EPG
                 epg.add_program(channel_id, prog)
                 program_count += 1
-                
-                # Create a channel if needed
-                if channel_id not in epg.channels:
-                    channel_count += 1
 
-            logger.info(f"EPG loaded: {channel_count} channels, {program_count} programs")
+            logger.info(
+                "EPG loaded: %d channels, %d programs", channel_count, program_count
+            )
 
             # Debug: Print some channel IDs
             channel_ids = epg.channels[:5] if len(epg.channels) > 5 else epg.channels
-            logger.debug(f"Sample channel IDs: {channel_ids}")
+            logger.debug("Sample channel IDs: %s", channel_ids)
 
             return epg
 
@@ -145,46 +197,11 @@ class EPGParser:
             raise ValueError("EPG file is empty")
 
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
-            if root.tag != "tv":
-                raise ValueError("Invalid XMLTV format: missing root 'tv' element")
-
             guide = EPGGuide()
             channel_count = 0
             program_count = 0
 
-            for program in root.findall(".//programme"):
-                channel_id = program.get("channel")
-                if not channel_id:
-                    continue
-
-                # Parse program data with new date parser
-                try:
-                    start_time = EPGParser.parse_date(program.get("start", ""))
-                    end_time = EPGParser.parse_date(program.get("stop", ""))
-                except ValueError as e:
-                    logger.warning(f"Skipping program due to invalid date: {e}")
-                    continue
-
-                title = program.find("title")
-                title_text = title.text if title is not None else "No Title"
-
-                desc = program.find("desc")
-                desc_text = desc.text if desc is not None else ""
-
-                category = program.find("category")
-                category_text = category.text if category is not None else ""
-
-                prog = Program(
-                    title=title_text,
-                    start_time=start_time,
-                    end_time=end_time,
-                    description=desc_text,
-                    category=category_text,
-                )
-
+            for channel_id, prog in EPGParser._iter_programs(file_path):
                 # Add to guide
                 channel_data = guide.get_channel_data(channel_id)
                 if channel_data is None:
@@ -192,10 +209,12 @@ class EPGParser:
                     guide.add_channel_data(channel_id, channel_data)
                     channel_count += 1
 
-                channel_data.programs.append(prog)
+                channel_data.add(prog)
                 program_count += 1
 
-            logger.info(f"EPG loaded: {channel_count} channels, {program_count} programs")
+            logger.info(
+                "EPG loaded: %d channels, %d programs", channel_count, program_count
+            )
             return guide
 
         except Exception as e:
@@ -15,21 +15,12 @@ from models.playlist import Channel, Playlist
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Extracts key="value" attributes from EXTINF lines; compiled once at import
+_ATTR_RE = re.compile(r'\s([\w-]+)="([^"]*)"', re.ASCII)
+
 class M3UParser:
     """Utility class for parsing M3U/M3U8 playlist files."""
 
-    # Regular expression for parsing EXTINF lines with extended attributes
-    EXTINF_REGEX = re.compile(
-        r"#EXTINF:-1"
-        r'(?:.*?tvg-id="(.*?)")?'
-        r'(?:.*?tvg-name="(.*?)")?'
-        r'(?:.*?group-title="(.*?)")?'
-        r'(?:.*?tvg-logo="(.*?)")?'
-        r'(?:.*?tvg-chno="(.*?)")?'
-        r'(?:.*?tvg-shift="(.*?)")?'
-        r",(.+)$"
-    )
-
     @staticmethod
     def parse(file_path: str | Path) -> Playlist:
         """Parse an M3U/M3U8 file and return a Playlist object.
@@ -54,11 +45,14 @@ class M3UParser:
         
         # Calculate source hash for caching
         try:
+            digest = hashlib.md5()
             with open(file_path, "rb") as f:
-                content = f.read()
-                playlist.source_hash = hashlib.md5(content).hexdigest()
+                # Hash in chunks so large playlists are never held in memory
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            playlist.source_hash = digest.hexdigest()
         except Exception as e:
-            logger.warning(f"Could not calculate source hash: {e}")
+            logger.warning("Could not calculate source hash: %s", e)
             playlist.source_hash = ""
 
         try:
@@ -69,11 +63,11 @@ class M3UParser:
                 for channel in channels:
                     playlist.add_channel(channel)
 
-            logger.info(f"Successfully parsed {len(playlist.channels)} channels from {file_path}")
+            logger.info("Successfully parsed %d channels from %s", len(playlist.channels), file_path)
             return playlist
 
         except UnicodeDecodeError:
-            logger.warning(f"UTF-8 decode failed for {file_path}, trying ISO-8859-1")
+            logger.warning("UTF-8 decode failed for %s, trying ISO-8859-1", file_path)
             # Fallback to ISO-8859-1 if UTF-8 fails
             try:
                 with open(file_path, "r", encoding="ISO-8859-1") as f:
@@ -82,10 +76,14 @@ class M3UParser:
                     for channel in channels:
                         playlist.add_channel(channel)
                 
-                logger.info(f"Successfully parsed {len(playlist.channels)} channels from {file_path} using ISO-8859-1")
+                logger.info(
+                    "Successfully parsed %d channels from %s using ISO-8859-1",
+                    len(playlist.channels),
+                    file_path,
+                )
                 return playlist
             except Exception as e:
-                logger.error(f"Failed to parse with ISO-8859-1: {e}")
+                logger.error("Failed to parse with ISO-8859-1: %s", e)
                 raise ValueError(f"Failed to parse playlist with multiple encodings") from e
         except Exception as e:
             raise ValueError(f"Error parsing M3U file: {str(e)}") from e
@@ -117,62 +115,79 @@ class M3UParser:
             List of parsed Channel objects.
         """
         channels: list[Channel] = []
-        current_channel: Optional[Dict[str, str]] = None
+        current_channel: Optional[Dict[str, Any]] = None
 
         for line in file:
+            # Classify on a fixed-width prefix so comment lines are skipped
+            # without being stripped first
+            if line[:7] == "#EXTINF":
+                current_channel = M3UParser._parse_extinf(line.rstrip())
+                continue
+            if line[:1] == "#":
+                continue
+
             line = line.strip()
             if not line:
                 continue
+            if line[:1] == "#":
+                # Indented directive; only EXTINF carries channel metadata
+                if line[:7] == "#EXTINF":
+                    current_channel = M3UParser._parse_extinf(line)
+                continue
 
-            if line.startswith("#EXTINF"):
-                match = M3UParser.EXTINF_REGEX.match(line)
-                if match:
-                    epg_id = match.group(1) or ""
-                    name = match.group(2) or match.group(7) or "Unknown Channel"
-                    group = match.group(3) or "Uncategorized"
-                    logo = match.group(4) or ""
-                    channel_number = match.group(5) or ""
-                    time_shift = match.group(6) or "0"
-                    
-                    current_channel = {
-                        "name": name,
-                        "group": group,
-                        "logo": logo,
-                        "epg_id": epg_id,
-                        "channel_number": channel_number,
-                        "time_shift": time_shift
-                    }
             # Handle url lines (non-comment lines that follow an EXTINF line)
-            elif not line.startswith("#") and current_channel is not None:
+            if current_channel is not None:
                 try:
-                    channel_data = dict(current_channel)  # Make a copy to avoid reference issues
-                    
-                    # Create channel with all available metadata
-                    channel = Channel(
-                        name=channel_data.get("name", "Unknown"),
-                        url=line,
-                        group=channel_data.get("group", "Uncategorized"),
-                        logo=channel_data.get("logo", ""),
-                        epg_id=channel_data.get("epg_id", ""),
-                    )
-                    
-                    # Add additional properties
-                    if "channel_number" in channel_data and channel_data["channel_number"]:
-                        try:
-                            channel.channel_number = int(channel_data["channel_number"])
-                        except ValueError:
-                            logger.warning(f"Invalid channel number: {channel_data['channel_number']}")
-                            
-                    if "time_shift" in channel_data and channel_data["time_shift"]:
-                        try:
-                            channel.time_shift = int(channel_data["time_shift"])
-                        except ValueError:
-                            logger.warning(f"Invalid time shift: {channel_data['time_shift']}")
-                    
-                    channels.append(channel)
+                    # Metadata is already in Channel keyword form
+                    channels.append(Channel(url=line, **current_channel))
                 except Exception as e:
-                    logger.warning(f"Error creating channel from line '{line}': {str(e)}")
-                    
+                    logger.warning("Error creating channel from line '%.100s': %s", line, e)
+
                 current_channel = None
 
         return channels
+
+    @staticmethod
+    def _parse_extinf(line: str) -> Dict[str, Any]:
+        """Extract channel metadata from an EXTINF line.
+
+        Attributes are collected in a single linear scan, and the display name
+        is whatever follows the first comma after the last attribute. Numeric
+        fields are converted here so URL lines can build a Channel directly.
+
+        Args:
+            line: A stripped line starting with "#EXTINF".
+
+        Returns:
+            Dictionary of Channel keyword arguments (everything except url).
+        """
+        attrs = {}
+        attrs_end = 0
+        for match in _ATTR_RE.finditer(line):
+            attrs[match.group(1)] = match.group(2)
+            attrs_end = match.end()
+
+        _, _, display_name = line[attrs_end:].partition(",")
+
+        channel_number = 0
+        if attrs.get("tvg-chno"):
+            try:
+                channel_number = int(attrs["tvg-chno"])
+            except ValueError:
+                logger.warning("Invalid channel number: %s", attrs["tvg-chno"])
+
+        time_shift = 0
+        if attrs.get("tvg-shift"):
+            try:
+                time_shift = int(attrs["tvg-shift"])
+            except ValueError:
+                logger.warning("Invalid time shift: %s", attrs["tvg-shift"])
+
+        return {
+            "name": attrs.get("tvg-name") or display_name.strip() or "Unknown Channel",
+            "group": attrs.get("group-title") or "Uncategorized",
+            "logo": attrs.get("tvg-logo", ""),
+            "epg_id": attrs.get("tvg-id", ""),
+            "channel_number": channel_number,
+            "time_shift": time_shift,
+        }
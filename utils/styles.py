@@ -1,5 +1,9 @@
 """
 Module containing stylesheet definitions for the application.
+
+Widget rules are scoped with objectName/property selectors so they can live in
+the single application-level stylesheet instead of per-widget setStyleSheet
+calls, which each force Qt to build and cascade a separate style sheet.
 """
 
 
@@ -7,7 +11,7 @@ class SearchBarStyle:
     """Styles for the search bar widget."""
 
     SEARCH_BAR = """
-        QLineEdit {
+        QLineEdit#SearchBar {
             padding: 8px 12px 8px 36px;
             border-radius: 20px;
             min-width: 250px;
@@ -15,11 +19,11 @@ class SearchBarStyle:
             border: 1px solid #404040;
             font-size: 13px;
         }
-        QLineEdit:focus {
+        QLineEdit#SearchBar:focus {
             border: 1px solid #666666;
             background-color: #333333;
         }
-        QLineEdit:hover {
+        QLineEdit#SearchBar:hover {
             background-color: #333333;
         }
     """
@@ -29,9 +33,125 @@ class ToolbarStyle:
     """Styles for the toolbar."""
 
     TOOLBAR = """
-        QToolBar {
+        QToolBar#MainToolbar {
             spacing: 10px;
             padding: 5px 15px;
             background: transparent;
         }
     """
+
+
+class NotificationStyle:
+    """Styles for the notification widget, selected by its "level" property."""
+
+    NOTIFICATION = """
+        QLabel#Notification {
+            padding: 10px;
+            border-radius: 5px;
+            font-weight: bold;
+        }
+        QLabel#Notification[level="info"] {
+            background-color: #2196F3;
+            border: 1px solid #1976D2;
+            color: #FFFFFF;
+        }
+        QLabel#Notification[level="success"] {
+            background-color: #4CAF50;
+            border: 1px solid #388E3C;
+            color: #FFFFFF;
+        }
+        QLabel#Notification[level="warning"] {
+            background-color: #FFC107;
+            border: 1px solid #FFA000;
+            color: #000000;
+        }
+        QLabel#Notification[level="error"] {
+            background-color: #F44336;
+            border: 1px solid #D32F2F;
+            color: #FFFFFF;
+        }
+    """
+
+
+class PlayerStyle:
+    """Styles for the player widget."""
+
+    STATUS_OVERLAY = """
+        QLabel#StatusOverlay {
+            background-color: rgba(0, 0, 0, 128);
+            color: white;
+            font-weight: bold;
+            padding: 10px;
+            border-radius: 5px;
+        }
+    """
+
+
+class PiPStyle:
+    """Styles for the Picture-in-Picture window and its fullscreen view."""
+
+    PIP_WINDOW = """
+        PiPWindow {
+            background-color: #1a1a1a;
+            border: 1px solid #404040;
+            border-radius: 4px;
+        }
+        QWidget#PiPTitleBar {
+            background-color: #2d2d2d;
+            border-top-left-radius: 4px;
+            border-top-right-radius: 4px;
+        }
+        QPushButton#PiPDragHandle {
+            background: transparent;
+            border: none;
+            color: #808080;
+            font-size: 16px;
+            padding: 2px 8px;
+        }
+        QPushButton#PiPDragHandle:hover {
+            color: #ffffff;
+        }
+        QWidget#PiPVideo {
+            background-color: #000000;
+            border: none;
+        }
+        QWidget#PiPControls {
+            background-color: #2d2d2d;
+            border-bottom-left-radius: 4px;
+            border-bottom-right-radius: 4px;
+        }
+        QWidget#PiPControls QPushButton {
+            min-width: 60px;
+            padding: 4px 8px;
+            background-color: #3d3d3d;
+            border: none;
+            border-radius: 2px;
+            color: #ffffff;
+        }
+        QWidget#PiPControls QPushButton:hover {
+            background-color: #4d4d4d;
+        }
+        QWidget#PiPControls QPushButton:pressed {
+            background-color: #2d2d2d;
+        }
+        QSizeGrip#PiPSizeGrip {
+            background-color: #2d2d2d;
+            width: 16px;
+            height: 16px;
+        }
+        FullscreenPiP {
+            background-color: black;
+        }
+    """
+
+
+class WidgetStyle:
+    """Widget rules shared by every theme."""
+
+    ALL = (
+        SearchBarStyle.SEARCH_BAR
+        + ToolbarStyle.TOOLBAR
+        + NotificationStyle.NOTIFICATION
+        + PlayerStyle.STATUS_OVERLAY
+        + PiPStyle.PIP_WINDOW
+    )
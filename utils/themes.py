@@ -3,14 +3,10 @@ This module provides utilities for managing themes.
 It defines the Themes class, which can get the CSS for the dark and light themes.
 """
 
+from utils.styles import WidgetStyle
 
-class Themes:
-    """Utility class for managing themes."""
-
-    @staticmethod
-    def get_dark_theme() -> str:
-        """Get the CSS for the dark theme."""
-        return """
+# Stylesheets are built once at import; Themes hands out the same objects
+_DARK_THEME = """
             QMainWindow, QWidget {
                 background-color: #1a1a1a;
                 color: #ffffff;
@@ -130,12 +126,9 @@ class Themes:
             QLabel#current_time {
                 color: #aaaaaa;
             }
-        """
+        """ + WidgetStyle.ALL
 
-    @staticmethod
-    def get_light_theme() -> str:
-        """Get the CSS for the light theme."""
-        return """
+_LIGHT_THEME = """
             QMainWindow, QWidget {
                 background-color: #f5f5f5;
                 color: #333333;
@@ -257,4 +250,18 @@ class Themes:
             QLabel#current_time {
                 color: #666666;
             }
-        """
+        """ + WidgetStyle.ALL
+
+
+class Themes:
+    """Utility class for managing themes."""
+
+    @staticmethod
+    def get_dark_theme() -> str:
+        """Get the CSS for the dark theme."""
+        return _DARK_THEME
+
+    @staticmethod
+    def get_light_theme() -> str:
+        """Get the CSS for the light theme."""
+        return _LIGHT_THEME
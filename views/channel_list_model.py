@@ -0,0 +1,62 @@
+"""
+Module containing the ChannelListModel used by the channel and favorites lists.
+"""
+
+from typing import List, Optional
+
+# pylint: disable=no-name-in-module
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+from models.playlist import Channel
+
+
+class ChannelListModel(QAbstractListModel):
+    """A list model that serves channel names straight from a list of Channels.
+
+    Unlike QListWidget, no per-row item object is created; Qt asks for the
+    data of visible rows only.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._channels: List[Channel] = []
+
+    def rowCount(self, parent=QModelIndex()):  # pylint: disable=invalid-name
+        """Return the number of channels in the model."""
+        if parent.isValid():
+            return 0
+        return len(self._channels)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the channel name for display, or the Channel for UserRole."""
+        if not index.isValid():
+            return None
+
+        channel = self._channels[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return channel.name
+        if role == Qt.ItemDataRole.UserRole:
+            return channel
+        return None
+
+    def set_channels(self, channels: List[Channel]) -> None:
+        """Replace the model contents in a single reset.
+
+        Args:
+            channels: The channels to display.
+        """
+        self.beginResetModel()
+        self._channels = list(channels)
+        self.endResetModel()
+
+    def channel_at(self, row: int) -> Optional[Channel]:
+        """Get the channel at the given row.
+
+        Args:
+            row: The row index.
+
+        Returns:
+            The channel at that row, or None if the row is out of range.
+        """
+        if 0 <= row < len(self._channels):
+            return self._channels[row]
+        return None
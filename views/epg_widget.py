@@ -14,6 +14,11 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 
 
+def _hhmm(value: datetime) -> str:
+    """Format a datetime as HH:MM without going through strftime."""
+    return f"{value.hour:02d}:{value.minute:02d}"
+
+
 class EPGWidget(QFrame):
     """A widget to display the Electronic Program Guide (EPG)."""
 
@@ -35,7 +40,7 @@ class EPGWidget(QFrame):
 
         # Current program
         self.current_title = QLabel("No program information")
-        self.current_title.setStyleSheet("font-weight: bold;")
+        self.current_title.setObjectName("current_title")
         self.current_title.setWordWrap(True)
         scroll_layout.addWidget(self.current_title)
 
@@ -79,7 +84,7 @@ class EPGWidget(QFrame):
             return
             
         # Format the time string
-        time_str = f"{start_time.strftime('%H:%M')} - {end_time.strftime('%H:%M')}"
+        time_str = f"{_hhmm(start_time)} - {_hhmm(end_time)}"
         
         # Update the UI components
         self.current_title.setText(title)
@@ -104,7 +109,7 @@ class EPGWidget(QFrame):
         if not title:
             return
             
-        time_str = start_time.strftime("%H:%M")
+        time_str = _hhmm(start_time)
         self.upcoming_list.addItem(f"{time_str} - {title}")
 
     def clear_upcoming_programs(self):
@@ -123,12 +128,20 @@ class EPGWidget(QFrame):
     def set_upcoming_programs(self, programs: list):
         """Set the list of upcoming programs.
         
-        Legacy method for backward compatibility.
+        The list is filled with a single addItems call while repaints are
+        suspended, instead of one model insert per program.
         
         Args:
             programs: List of Program objects
         """
-        self.upcoming_list.clear()
-        for prog in programs:
-            time_str = prog.start_time.strftime("%H:%M")
-            self.upcoming_list.addItem(f"{time_str} - {prog.title}")
+        items = [
+            f"{_hhmm(prog.start_time)} - {prog.title}"
+            for prog in programs
+            if prog.title
+        ]
+        self.upcoming_list.setUpdatesEnabled(False)
+        try:
+            self.upcoming_list.clear()
+            self.upcoming_list.addItems(items)
+        finally:
+            self.upcoming_list.setUpdatesEnabled(True)
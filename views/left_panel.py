@@ -2,7 +2,14 @@
 Module containing the LeftPanel widget for channel navigation and EPG display.
 """
 
-from PyQt6.QtWidgets import QFrame, QVBoxLayout, QComboBox, QTabWidget, QListWidget
+from PyQt6.QtWidgets import (
+    QFrame,
+    QVBoxLayout,
+    QComboBox,
+    QTabWidget,
+    QListView,
+)
+from views.channel_list_model import ChannelListModel
 from views.epg_widget import EPGWidget
 
 
@@ -24,8 +31,18 @@ class LeftPanel(QFrame):
 
         # Add tabs for channels and favorites
         self.tabs = QTabWidget()
-        self.channel_list = QListWidget()
-        self.favorites_list = QListWidget()
+        self.channel_list = QListView()
+        self.favorites_list = QListView()
+
+        # Large playlists: lay out in batches and skip per-row size hints
+        for list_widget in (self.channel_list, self.favorites_list):
+            list_widget.setModel(ChannelListModel(list_widget))
+            list_widget.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+            list_widget.setLayoutMode(QListView.LayoutMode.Batched)
+            list_widget.setBatchSize(200)
+            list_widget.setUniformItemSizes(True)
+            # Needed for the entered signal used to warm up stream hosts
+            list_widget.setMouseTracking(True)
 
         self.tabs.addTab(self.channel_list, "Channels")
         self.tabs.addTab(self.favorites_list, "Favorites")
@@ -4,16 +4,16 @@ This module contains the main window of the Simple IPTV Player application.
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import (
+    QApplication,
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QToolBar,
     QSplitter,
     QPushButton,
+    QMessageBox,
 )
 from PyQt6.QtCore import Qt
-from utils.themes import Themes
-from utils.styles import ToolbarStyle
 from views.notification import NotificationWidget, NotificationType
 from views.search_bar import SearchBar
 from views.left_panel import LeftPanel
@@ -30,20 +30,22 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Simple IPTV Player")
         self.setMinimumSize(1280, 720)
 
-        # Initialize components
-        self._init_ui()
-        self._setup_toolbar()
-        self.menu_bar = MenuBar(self)  # Store reference to menu bar
-        self.setMenuBar(self.menu_bar)
+        # Suspend repaints while the widget tree is assembled
+        self.setUpdatesEnabled(False)
+        try:
+            # Initialize components
+            self._init_ui()
+            self._setup_toolbar()
+            self.menu_bar = MenuBar(self)  # Store reference to menu bar
+            self.setMenuBar(self.menu_bar)
 
-        # Apply theme
-        self.setStyleSheet(Themes.get_dark_theme())
+            # Notification widget is created on first use
+            self._notification = None
 
-        # Create notification widget
-        self.notification = NotificationWidget(self)
-
-        self.playback_manager = PlaybackManager(self)
-        self.setup_playback_features()
+            self.playback_manager = PlaybackManager(self)
+            self.setup_playback_features()
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Initialize player_controller to None - it will be set from main.py
         self.player_controller = None
@@ -70,6 +72,18 @@ class MainWindow(QMainWindow):
         return self.menu_bar.load_epg_url_button
 
     # Add property getters for UI components
+    @property
+    def notification(self):
+        """Get the notification widget, creating it on first access."""
+        if self._notification is None:
+            self._notification = NotificationWidget(self)
+        return self._notification
+
+    @property
+    def epg_widget(self):
+        """Get the EPG widget."""
+        return self.left_panel.epg_widget
+
     @property
     def category_combo(self):
         """Get the category combo box."""
@@ -136,9 +150,9 @@ class MainWindow(QMainWindow):
     def _setup_toolbar(self):
         """Setup the toolbar with search functionality."""
         self.toolbar = QToolBar()
+        self.toolbar.setObjectName("MainToolbar")
         self.toolbar.setMovable(False)
         self.toolbar.setFloatable(False)
-        self.toolbar.setStyleSheet(ToolbarStyle.TOOLBAR)
 
         self.search_bar = SearchBar()
         self.toolbar.addWidget(self.search_bar)
@@ -160,8 +174,23 @@ class MainWindow(QMainWindow):
             self.toolbar.show()
 
     def apply_theme(self, theme: str):
-        """Apply the given theme to the main window."""
-        self.setStyleSheet(theme)
+        """Apply the given theme to the whole application.
+
+        Re-applying the active stylesheet is skipped, since Qt would re-parse
+        it and re-polish every widget even though nothing changed.
+        """
+        app = QApplication.instance()
+        if theme == app.styleSheet():
+            return
+        app.setStyleSheet(theme)
+
+    def on_vlc_loaded(self, success: bool, error: str):
+        """Attach the player once VLC has loaded, or report the failure."""
+        if not success:
+            QMessageBox.critical(self, "Error", f"Failed to initialize VLC:\n{error}")
+            self.close()
+            return
+        self.player_widget.attach_vlc()
 
     def show_notification(
         self, message: str, notification_type: NotificationType = NotificationType.INFO
@@ -175,11 +204,7 @@ class MainWindow(QMainWindow):
         self.pip_btn.clicked.connect(self.toggle_pip_mode)
 
         # Add to right panel's controls
-        if hasattr(self.right_panel, "controls_layout"):
-            self.right_panel.controls_layout.addWidget(self.pip_btn)
-        else:
-            # Fallback to adding directly to right panel's layout
-            self.right_panel.layout().addWidget(self.pip_btn)
+        self.right_panel.add_control(self.pip_btn)
 
     def toggle_pip_mode(self):
         print("PiP button clicked")  # Debug
@@ -13,55 +13,93 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QAction
 
+# Menu layout: (menu title, entries). Each entry is
+# (text, shortcut, status tip, attribute name, parent slot name), or None
+# for a separator. Actions with an attribute name are exposed on the menu bar;
+# actions with a parent slot are connected to that method of the parent window.
+_MENU_SPEC = (
+    (
+        "&File",
+        (
+            ("&Playlist Manager", "Ctrl+P", "Open playlist manager", "playlist_manager_action", None),
+            None,
+            ("&Exit", "Ctrl+Q", "Exit application", None, "close"),
+        ),
+    ),
+    (
+        "&EPG",
+        (
+            ("Load from &File...", None, "Load EPG data from XML file", "load_epg_file_action", None),
+        ),
+    ),
+)
+
 
 class MenuBar(QMenuBar):
     """The main menu bar for the application."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._init_file_menu()
-        self._init_epg_menu()
+        self._epg_url_input = None
+        self._load_epg_url_button = None
+        menus = self._build_menus()
 
-    def _init_file_menu(self):
-        """Initialize the File menu."""
-        file_menu = self.addMenu("&File")
+        # The EPG URL input row is only built when the menu is first opened
+        self.epg_menu = menus["&EPG"]
+        self.epg_menu.aboutToShow.connect(self._init_epg_url_row)
 
-        # Add Playlist Manager action
-        self.playlist_manager_action = QAction("&Playlist Manager", self)
-        self.playlist_manager_action.setShortcut("Ctrl+P")
-        self.playlist_manager_action.setStatusTip("Open playlist manager")
-        file_menu.addAction(self.playlist_manager_action)
+    @property
+    def epg_url_input(self):
+        """Get the EPG URL input, building the URL row on first access."""
+        if self._epg_url_input is None:
+            self._init_epg_url_row()
+        return self._epg_url_input
 
-        # Add separator
-        file_menu.addSeparator()
+    @property
+    def load_epg_url_button(self):
+        """Get the load EPG URL button, building the URL row on first access."""
+        if self._load_epg_url_button is None:
+            self._init_epg_url_row()
+        return self._load_epg_url_button
 
-        # Add Exit action
-        exit_action = QAction("&Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.setStatusTip("Exit application")
-        exit_action.triggered.connect(self.parent().close)
-        file_menu.addAction(exit_action)
+    def _build_menus(self):
+        """Build every menu and action described by _MENU_SPEC."""
+        menus = {}
+        for title, entries in _MENU_SPEC:
+            menu = self.addMenu(title)
+            menus[title] = menu
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
 
-    def _init_epg_menu(self):
-        """Initialize the EPG menu."""
-        epg_menu = self.addMenu("&EPG")
+                text, shortcut, status_tip, attr_name, slot_name = entry
+                action = QAction(text, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.setStatusTip(status_tip)
+                if slot_name:
+                    action.triggered.connect(getattr(self.parent(), slot_name))
+                if attr_name:
+                    setattr(self, attr_name, action)
+                menu.addAction(action)
+        return menus
 
-        # Add EPG actions
-        self.load_epg_file_action = QAction("Load from &File...", self)
-        self.load_epg_file_action.setStatusTip("Load EPG data from XML file")
-        epg_menu.addAction(self.load_epg_file_action)
+    def _init_epg_url_row(self):
+        """Add the EPG URL input row to the EPG menu if not yet built."""
+        if self._epg_url_input is not None:
+            return
 
-        # Add URL input
-        self.epg_url_input = QLineEdit()
-        self.epg_url_input.setPlaceholderText("Enter EPG URL...")
-        self.load_epg_url_button = QPushButton("Load")
+        self._epg_url_input = QLineEdit()
+        self._epg_url_input.setPlaceholderText("Enter EPG URL...")
+        self._load_epg_url_button = QPushButton("Load")
 
         url_widget = QWidget()
         url_layout = QHBoxLayout(url_widget)
         url_layout.setContentsMargins(8, 0, 8, 0)
-        url_layout.addWidget(self.epg_url_input)
-        url_layout.addWidget(self.load_epg_url_button)
+        url_layout.addWidget(self._epg_url_input)
+        url_layout.addWidget(self._load_epg_url_button)
 
-        url_action = QWidgetAction(epg_menu)
+        url_action = QWidgetAction(self.epg_menu)
         url_action.setDefaultWidget(url_widget)
-        epg_menu.addAction(url_action)
+        self.epg_menu.addAction(url_action)
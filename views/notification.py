@@ -2,12 +2,11 @@
 This module contains the NotificationWidget class, which is responsible for displaying notifications.
 """
 
-from dataclasses import dataclass
 from enum import Enum, auto
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 
 
 class NotificationType(Enum):
@@ -19,24 +18,12 @@ class NotificationType(Enum):
     ERROR = auto()
 
 
-@dataclass
-class NotificationStyle:
-    """Data class to define the style attributes for a notification."""
-
-    background: str
-    border: str
-    text_color: str
-
-
 class NotificationWidget(QLabel):
-    """A widget to display notifications with different styles and durations."""
+    """A widget to display notifications with different styles and durations.
 
-    STYLES = {
-        NotificationType.INFO: NotificationStyle("#2196F3", "#1976D2", "#FFFFFF"),
-        NotificationType.SUCCESS: NotificationStyle("#4CAF50", "#388E3C", "#FFFFFF"),
-        NotificationType.WARNING: NotificationStyle("#FFC107", "#FFA000", "#000000"),
-        NotificationType.ERROR: NotificationStyle("#F44336", "#D32F2F", "#FFFFFF"),
-    }
+    Colors come from the QLabel#Notification[level=...] rules in the
+    application stylesheet; only the "level" property changes per message.
+    """
 
     def __init__(self, parent=None):
         """
@@ -47,17 +34,12 @@ class NotificationWidget(QLabel):
         """
         super().__init__(parent)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet(
-            """
-            padding: 10px;
-            border-radius: 5px;
-            font-weight: bold;
-        """
-        )
+        self.setObjectName("Notification")
+        self.setProperty("level", "info")
         self.hide()
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.hide)
+        # Id of the pending hide timer, 0 when none is running
+        self._hide_timer_id = 0
 
     def show_message(
         self, message: str, notification_type: NotificationType, duration: int = 3000
@@ -70,17 +52,12 @@ class NotificationWidget(QLabel):
             type (NotificationType): The type of notification to determine the style.
             duration (int): The duration in milliseconds for which the notification is displayed.
         """
-        style = self.STYLES[notification_type]
-        self.setStyleSheet(
-            f"""
-            background-color: {style.background};
-            border: 1px solid {style.border};
-            color: {style.text_color};
-            padding: 10px;
-            border-radius: 5px;
-            font-weight: bold;
-        """
-        )
+        level = notification_type.name.lower()
+        if self.property("level") != level:
+            self.setProperty("level", level)
+            # Property selectors are only re-evaluated on a fresh polish
+            self.style().unpolish(self)
+            self.style().polish(self)
 
         self.setText(message)
         self.adjustSize()
@@ -90,4 +67,17 @@ class NotificationWidget(QLabel):
         parent_rect = self.parent().rect()
         self.move((parent_rect.width() - self.width()) // 2, 20)
 
-        self.timer.start(duration)
+        # A new message replaces the pending hide of the previous one
+        if self._hide_timer_id:
+            self.killTimer(self._hide_timer_id)
+        self._hide_timer_id = self.startTimer(duration, Qt.TimerType.CoarseTimer)
+
+    def timerEvent(self, event):
+        """Hide the notification when its display time has elapsed."""
+        if event.timerId() != self._hide_timer_id:
+            super().timerEvent(event)
+            return
+
+        self.killTimer(self._hide_timer_id)
+        self._hide_timer_id = 0
+        self.hide()
@@ -3,19 +3,128 @@ This module contains the PlayerWidget class,
 which is responsible for displaying and controlling VLC media playback.
 """
 
-import sys
 import logging
-import time
+import socket
 import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import QFrame, QLabel, QVBoxLayout, QWidget, QMessageBox
-from PyQt6.QtCore import Qt, pyqtSignal, QObject
-from views.vlc_manager import VLCManager
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer
+from views.vlc_manager import VLCManager, HW_DECODE_OPTION
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Low-latency live protocols get a minimal jitter buffer
+_LIVE_SCHEMES = frozenset(("rtsp", "udp", "rtp", "mms"))
+
+# Per-media caching options for each latency profile
+_LATENCY_OPTIONS = {
+    "live": (
+        ":rtsp-tcp",
+        ":network-caching=150",
+        ":live-caching=0",
+        ":file-caching=0",
+    ),
+    "hls": (":network-caching=500",),
+    "vod": (":network-caching=1000",),
+}
+
+
+def _latency_profile(url: str) -> str:
+    """Pick the caching profile for a stream URL.
+
+    Args:
+        url: The stream URL.
+
+    Returns:
+        "live" for RTSP/UDP/RTP/MMS, "hls" for HLS playlists and MPEG-TS
+        segments, otherwise "vod".
+    """
+    parsed = urlparse(url)
+    if parsed.scheme.lower() in _LIVE_SCHEMES:
+        return "live"
+    if parsed.path.lower().endswith((".m3u8", ".ts")):
+        return "hls"
+    return "vod"
+
+
+def build_media(instance, url: str, latency_profile: str = "auto"):
+    """Create VLC media for a URL with the app's playback options applied.
+
+    Args:
+        instance: The VLC instance that creates the media.
+        url: The stream URL.
+        latency_profile: "live", "hls", "vod", or "auto" to pick from the URL.
+
+    Returns:
+        The new VLC media; the caller owns the reference.
+    """
+    if latency_profile == "auto":
+        latency_profile = _latency_profile(url)
+
+    # Create media with optimized options
+    media = instance.media_new(url)
+
+    # Configure caching for live, HLS or on-demand streams
+    for option in _LATENCY_OPTIONS[latency_profile]:
+        media.add_option(option)
+
+    # Decode on the GPU where the platform supports it
+    media.add_option(HW_DECODE_OPTION)
+
+    # Add adaptive streaming options for HLS/DASH
+    if url.endswith((".m3u8", ".mpd")):
+        media.add_option(":adaptive-logic=highest")
+        media.add_option(":adaptive-maxwidth=1920")
+        media.add_option(":adaptive-maxheight=1080")
+    return media
+
+
+# Number of recently played channels whose configured media is kept for reuse
+_MEDIA_CACHE_SIZE = 8
+
+# Seconds before a host that was already warmed is looked up again
+_DNS_WARM_INTERVAL = 60.0
+
+# Host name -> time.monotonic() of its last warm-up; only touched on the GUI thread
+_warmed_hosts = {}
+
+
+def _resolve_quietly(host: str) -> None:
+    """Resolve a host name, ignoring failures; libVLC reports them when it connects."""
+    try:
+        socket.getaddrinfo(host, None)
+    except OSError:
+        pass
+
+
+def _warm_dns(url: str) -> None:
+    """Start resolving the stream host so libVLC hits a warm resolver cache.
+
+    Args:
+        url: The stream URL. URLs without a host name are ignored.
+    """
+    host = urlparse(url).hostname
+    if not host:
+        return
+
+    # Playlists usually serve every channel from a few hosts, so hovering
+    # along the list only starts a lookup for hosts not warmed recently
+    now = time.monotonic()
+    last = _warmed_hosts.get(host)
+    if last is not None and now - last < _DNS_WARM_INTERVAL:
+        return
+    _warmed_hosts[host] = now
+
+    # Daemon thread, so a lookup stuck on a slow resolver never delays exit
+    threading.Thread(
+        target=_resolve_quietly, args=(host,), name="dns-warmup", daemon=True
+    ).start()
+
 
 class MediaEventHandler(QObject):
     """Handler for VLC media events with Qt signals."""
@@ -56,6 +165,11 @@ class MediaEventHandler(QObject):
         """Handle MediaPlayerEncounteredError event."""
         error_msg = "Media playback failed"
         logger.error(error_msg)
+
+        # libVLC's own messages usually say why the stream failed
+        recent_logs = VLCManager.dump_logs()
+        if recent_logs:
+            logger.error("Recent libVLC messages:\n%s", "\n".join(recent_logs))
         self.error_occurred.emit(error_msg)
     
     def _on_buffering(self, event):
@@ -84,13 +198,61 @@ class PlayerWidget(QFrame):
         # Create status overlay
         self.status_overlay = QLabel()
         self.status_overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_overlay.setStyleSheet("background-color: rgba(0, 0, 0, 128); color: white; font-weight: bold; padding: 10px; border-radius: 5px;")
+        self.status_overlay.setObjectName("StatusOverlay")
         self.status_overlay.hide()
         self.layout.addWidget(self.status_overlay)
+        self._status_text = ""
+
+        # Reusable timer that hides the status overlay on the GUI thread
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.timeout.connect(self.status_overlay.hide)
+
+        # VLC is attached by attach_vlc once it has finished loading
+        self.vlc_available = False
+        self.vlc = None
+        self.instance = None
+        self.player = None
+        self.event_handler = None
+        self.volume = 100
+        self.pending_url = None
+        self._media_cache = OrderedDict()
+
+        # Enable mouse tracking
+        self.setMouseTracking(True)
 
-        # Initialize VLC
-        success, error = VLCManager.initialize()
-        self.vlc_available = success
+        # Track fullscreen state
+        self.is_fullscreen = False
+        self.normal_geometry = None
+        self.normal_parent = None
+        self.normal_layout = None
+        self.normal_index = None
+        self.normal_stretch = None
+        
+        # Track current media
+        self.current_url = None
+        self.fullscreen_window = None
+        
+        # Setup reconnection mechanism
+        # Runs on the GUI thread, since reconnecting touches widgets
+        self.reconnect_timer = QTimer(self)
+        self.reconnect_timer.setSingleShot(True)
+        self.reconnect_timer.timeout.connect(self._reconnect)
+        self.reconnect_attempts = 0
+        self.max_reconnect_attempts = 5
+
+    def attach_vlc(self, success: bool = True, error: str = ""):
+        """Create the media player once VLC has been initialized.
+
+        Must run on the GUI thread, since the player is bound to this
+        widget's native window.
+
+        Args:
+            success: Whether VLC initialized successfully.
+            error: The initialization error message, if any.
+        """
+        if self.vlc_available:
+            return
         if not success:
             self.placeholder.setText(error)
             logger.error(error)
@@ -102,35 +264,25 @@ class PlayerWidget(QFrame):
 
         # Create player
         self.player = VLCManager.create_player()
-        
+        self.vlc_available = True
+
         # Create event handler
         self.event_handler = MediaEventHandler(self.player)
         self.event_handler.error_occurred.connect(self._handle_playback_error)
         self.event_handler.media_playing.connect(self._on_media_playing)
         self.event_handler.media_stopped.connect(self._on_media_stopped)
         self.event_handler.media_buffering.connect(self._on_media_buffering)
-        
-        self._setup_player()
 
-        # Enable mouse tracking
-        self.setMouseTracking(True)
+        self._setup_player()
+        self.player.audio_set_volume(self.volume)
 
-        # Track fullscreen state
-        self.is_fullscreen = False
-        self.normal_geometry = None
-        self.normal_parent = None
-        self.normal_layout = None
-        self.normal_index = None
-        self.normal_stretch = None
-        
-        # Track current media
-        self.current_url = None
-        self.fullscreen_window = None
-        
-        # Setup reconnection mechanism
-        self.reconnect_timer = threading.Timer(0, lambda: None)
-        self.reconnect_attempts = 0
-        self.max_reconnect_attempts = 5
+        # Start whatever was requested while VLC was still loading
+        if self.pending_url:
+            url, self.pending_url = self.pending_url, None
+            try:
+                self.play(url)
+            except Exception as e:
+                logger.error("Deferred playback failed: %s", e)
 
     def _setup_player(self):
         """Configure the VLC player instance."""
@@ -138,12 +290,7 @@ class PlayerWidget(QFrame):
             return
 
         # Set up the window for VLC playback
-        if sys.platform == "win32":
-            self.player.set_hwnd(self.winId())
-        elif sys.platform.startswith("linux"):
-            self.player.set_xwindow(self.winId())
-        elif sys.platform == "darwin":
-            self.player.set_nsobject(int(self.winId()))
+        VLCManager.set_output_window(self.player, self.winId())
 
         # Set optimized media options
         self.player.video_set_key_input(False)
@@ -155,12 +302,15 @@ class PlayerWidget(QFrame):
             if hasattr(self, 'fullscreen_window') and self.fullscreen_window:
                 self._exit_fullscreen()
             self.player.stop()
+            for media in self._media_cache.values():
+                media.release()
+            self._media_cache.clear()
             self.player.release()
             self.instance.release()
             self.vlc_available = False
             
             # Cancel any pending reconnect
-            self.reconnect_timer.cancel()
+            self.reconnect_timer.stop()
 
     def close_event(self, event):
         """Handle cleanup when widget is closed"""
@@ -169,59 +319,52 @@ class PlayerWidget(QFrame):
         
     def _show_status(self, message, duration=2000):
         """Show a temporary status message overlay."""
-        self.status_overlay.setText(message)
+        # Buffering events repeat the same percentage many times a second;
+        # only relayout the label when the text actually changes
+        if message != self._status_text:
+            self._status_text = message
+            self.status_overlay.setText(message)
         self.status_overlay.show()
-        
-        # Hide after duration
-        def hide_status():
-            self.status_overlay.hide()
-            
-        timer = threading.Timer(duration/1000, hide_status)
-        timer.daemon = True
-        timer.start()
 
-    def play(self, url: str):
+        # Hide after duration; restarting the timer extends the current message
+        self.status_timer.start(duration)
+
+    def warm_up(self, url: str):
+        """Start resolving a stream's host before the user picks it.
+
+        Called when the pointer moves onto a channel, so the lookup has a
+        head start on the click that hands the URL to libVLC.
+
+        Args:
+            url: The URL of the media that may be played next.
+        """
+        _warm_dns(url)
+
+    def play(self, url: str, latency_profile: str = "auto"):
         """Play media from the given URL.
 
         Args:
             url: The URL of the media to play.
+            latency_profile: "live", "hls" or "vod" caching options, or
+                "auto" to choose from the URL.
         """
         if not self.vlc_available:
+            # Played by attach_vlc once VLC has finished loading
+            self.pending_url = url
             return
             
         # Cancel any pending reconnect
-        self.reconnect_timer.cancel()
+        self.reconnect_timer.stop()
         self.reconnect_attempts = 0
         self.current_url = url
 
         try:
-            logger.info(f"Attempting to play: {url}")
+            logger.info("Attempting to play: %s", url)
             self._show_status("Connecting to stream...")
             
-            # Create media with optimized options
-            media = self.instance.media_new(url)
-            
-            # Configure network caching based on protocol
-            if url.startswith(("rtmp://", "rtsp://")):
-                # Use larger cache for RTMP/RTSP
-                media.add_option("network-caching=1500")
-            elif url.startswith("http"):
-                # Less cache for HTTP/HLS to reduce latency
-                media.add_option("network-caching=1000")
-            else:
-                # Default cache
-                media.add_option("network-caching=1000")
-                
-            # Add common options for better playback
-            media.add_option("clock-jitter=0")
-            media.add_option("clock-synchro=0")
-            media.add_option("no-audio-time-stretch")
-            
-            # Add adaptive streaming options for HLS/DASH
-            if url.endswith((".m3u8", ".mpd")):
-                media.add_option(":adaptive-logic=highest")
-                media.add_option(":adaptive-maxwidth=1920")
-                media.add_option(":adaptive-maxheight=1080")
+            if latency_profile == "auto":
+                latency_profile = _latency_profile(url)
+            media = self._get_media(url, latency_profile)
 
             self.player.set_media(media)
             result = self.player.play()
@@ -240,6 +383,35 @@ class PlayerWidget(QFrame):
             self.placeholder.show()
             raise e
 
+    def _get_media(self, url: str, latency_profile: str):
+        """Get configured media for a URL, reusing it when zapping back.
+
+        Args:
+            url: The URL of the media.
+            latency_profile: "live", "hls" or "vod" caching options.
+
+        Returns:
+            The VLC media with all playback options applied.
+        """
+        key = (url, latency_profile)
+        media = self._media_cache.get(key)
+        if media is not None:
+            self._media_cache.move_to_end(key)
+            return media
+
+        media = build_media(self.instance, url, latency_profile)
+        self._media_cache[key] = media
+        if len(self._media_cache) > _MEDIA_CACHE_SIZE:
+            # libVLC keeps its own reference while the player still uses it
+            _, evicted = self._media_cache.popitem(last=False)
+            evicted.release()
+        return media
+
+    def _evict_media(self, url: str):
+        """Drop cached media for a URL so the next attempt starts fresh."""
+        for key in [key for key in self._media_cache if key[0] == url]:
+            self._media_cache.pop(key).release()
+
     def _on_media_playing(self):
         """Handle when media starts playing."""
         self.placeholder.hide()
@@ -259,6 +431,9 @@ class PlayerWidget(QFrame):
 
     def _handle_playback_error(self, error_msg):
         """Handle VLC playback errors with auto-reconnect"""
+        if self.current_url:
+            self._evict_media(self.current_url)
+
         self.placeholder.setText(error_msg)
         self.placeholder.show()
         
@@ -272,25 +447,25 @@ class PlayerWidget(QFrame):
             self._show_status(reconnect_msg, duration=delay*1000)
             
             # Schedule reconnect
-            self.reconnect_timer.cancel()
-            self.reconnect_timer = threading.Timer(delay, self._reconnect)
-            self.reconnect_timer.daemon = True
-            self.reconnect_timer.start()
+            self.reconnect_timer.start(delay * 1000)
         else:
-            logger.error(f"Stream playback failed after {self.reconnect_attempts} attempts")
+            logger.error(
+                "Stream playback failed after %d attempts", self.reconnect_attempts
+            )
             self._show_status("Stream unavailable", duration=5000)
     
     def _reconnect(self):
         """Attempt to reconnect to the current stream."""
         if self.current_url:
-            logger.info(f"Attempting to reconnect to: {self.current_url}")
+            logger.info("Attempting to reconnect to: %s", self.current_url)
             try:
                 self.play(self.current_url)
             except Exception as e:
-                logger.error(f"Reconnection failed: {str(e)}")
+                logger.error("Reconnection failed: %s", e)
 
     def stop(self):
         """Stop media playback."""
+        self.pending_url = None
         if self.vlc_available:
             if hasattr(self, 'fullscreen_window') and self.fullscreen_window:
                 self._exit_fullscreen()
@@ -298,7 +473,7 @@ class PlayerWidget(QFrame):
             self.placeholder.show()
             
             # Cancel any pending reconnect
-            self.reconnect_timer.cancel()
+            self.reconnect_timer.stop()
             self.reconnect_attempts = 0
 
     def pause(self):
@@ -312,11 +487,15 @@ class PlayerWidget(QFrame):
         Args:
             volume: Integer between 0 and 100 representing volume percentage
         """
+        # Clamp volume between 0 and 100
+        volume = max(0, min(100, volume))
+        if volume == self.volume:
+            return
+        # Remembered so it can be applied once VLC is attached
+        self.volume = volume
         if not self.vlc_available:
             return
 
-        # Clamp volume between 0 and 100
-        volume = max(0, min(100, volume))
         self.player.audio_set_volume(volume)
 
     def is_paused(self) -> bool:
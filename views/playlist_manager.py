@@ -3,9 +3,8 @@ This module contains the PlaylistManagerDialog class,
 which is responsible for managing the playlist manager dialog.
 """
 
-import tempfile
 import os
-import requests
+from collections import namedtuple
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import (
@@ -21,7 +20,38 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QMenu,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
+from utils.downloader import check_url
+
+# Stored in each list item's UserRole; lighter than a per-item dict
+PlaylistEntry = namedtuple("PlaylistEntry", ["path", "is_url"])
+
+
+class _CheckSignals(QObject):
+    """Signals emitted by a _PlaylistCheckTask."""
+
+    finished = pyqtSignal(str)  # Emits url
+    failed = pyqtSignal(str, str)  # Emits (url, error)
+
+
+class _PlaylistCheckTask(QRunnable):
+    """Checks on a pool thread that a playlist URL is reachable."""
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+        # Created on the GUI thread, so emits from the pool thread are queued
+        self.signals = _CheckSignals()
+
+    def run(self):
+        """Check the playlist URL and report the result through the signals."""
+        try:
+            check_url(self.url, timeout=30)
+        except Exception as e:
+            self.signals.failed.emit(self.url, str(e))
+            return
+
+        self.signals.finished.emit(self.url)
 
 
 class PlaylistManagerDialog(QDialog):
@@ -94,6 +124,9 @@ class PlaylistManagerDialog(QDialog):
         # Set the window close button to trigger reject() instead of accept()
         self.setWindowFlag(Qt.WindowType.WindowCloseButtonHint)
 
+        # URL checks still running; keeps their signal objects alive
+        self._checks = set()
+
     def selection_changed(self):
         """Handle selection change in playlist list"""
         has_selection = bool(self.playlist_list.selectedItems())
@@ -117,33 +150,23 @@ class PlaylistManagerDialog(QDialog):
         )
 
         if ok and url:
-            tmp_path = None
-            try:
-                # Download the playlist
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-
-                # Save to temporary file
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=".m3u8"
-                ) as tmp_file:
-                    tmp_file.write(response.content)
-                    tmp_path = tmp_file.name
-
-                # Add to playlist list with URL as source
-                self._add_playlist_entry(url, is_url=True)
-
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Error", f"Failed to download playlist: {str(e)}"
-                )
-            finally:
-                # Clean up temporary file
-                if tmp_path and os.path.exists(tmp_path):
-                    try:
-                        os.unlink(tmp_path)
-                    except Exception as e:
-                        print(f"Failed to cleanup temporary file: {e}")
+            # Check the URL off the GUI thread so a slow server doesn't freeze the dialog
+            task = _PlaylistCheckTask(url)
+            task.signals.finished.connect(self._on_check_finished)
+            task.signals.failed.connect(self._on_check_failed)
+            self._checks.add(task.signals)
+            QThreadPool.globalInstance().start(task)
+
+    def _on_check_finished(self, url: str):
+        """Add a playlist entry once its URL has been checked"""
+        self._checks.discard(self.sender())
+        # Add to playlist list with URL as source
+        self._add_playlist_entry(url, is_url=True)
+
+    def _on_check_failed(self, _url: str, error: str):
+        """Report a playlist URL that could not be reached"""
+        self._checks.discard(self.sender())
+        QMessageBox.critical(self, "Error", f"Failed to download playlist: {error}")
 
     def _add_playlist_entry(self, path: str, is_url: bool = False):
         """Common method to add playlist entry"""
@@ -157,7 +180,7 @@ class PlaylistManagerDialog(QDialog):
         if ok and name:
             item = QListWidgetItem(name)
             # Store both path and type
-            item.setData(Qt.ItemDataRole.UserRole, {"path": path, "is_url": is_url})
+            item.setData(Qt.ItemDataRole.UserRole, PlaylistEntry(path, is_url))
             # Add tooltip showing full path/URL
             item.setToolTip(f"{'URL' if is_url else 'File'}: {path}")
             self.playlist_list.addItem(item)
@@ -181,7 +204,7 @@ class PlaylistManagerDialog(QDialog):
         current_item = self.playlist_list.currentItem()
         if current_item:
             data = current_item.data(Qt.ItemDataRole.UserRole)
-            self.playlist_selected.emit(data["path"], data["is_url"])
+            self.playlist_selected.emit(data.path, data.is_url)
             self.accept()
 
     def get_playlists(self):
@@ -190,17 +213,25 @@ class PlaylistManagerDialog(QDialog):
         for i in range(self.playlist_list.count()):
             item = self.playlist_list.item(i)
             data = item.data(Qt.ItemDataRole.UserRole)
-            playlists.append((item.text(), data["path"], data["is_url"]))
+            playlists.append((item.text(), data.path, data.is_url))
         return playlists
 
     def set_playlists(self, playlists):
         """Set playlists from list of (name, path, is_url) tuples"""
-        self.playlist_list.clear()
-        for name, path, is_url in playlists:
-            item = QListWidgetItem(name)
-            item.setData(Qt.ItemDataRole.UserRole, {"path": path, "is_url": is_url})
-            item.setToolTip(f"{'URL' if is_url else 'File'}: {path}")
-            self.playlist_list.addItem(item)
+        # Repaint and report the selection change once, not once per item
+        self.playlist_list.setUpdatesEnabled(False)
+        self.playlist_list.blockSignals(True)
+        try:
+            self.playlist_list.clear()
+            for name, path, is_url in playlists:
+                item = QListWidgetItem(name)
+                item.setData(Qt.ItemDataRole.UserRole, PlaylistEntry(path, is_url))
+                item.setToolTip(f"{'URL' if is_url else 'File'}: {path}")
+                self.playlist_list.addItem(item)
+        finally:
+            self.playlist_list.blockSignals(False)
+            self.playlist_list.setUpdatesEnabled(True)
+        self.selection_changed()
 
     def _show_context_menu(self, position):
         """Show context menu for playlist list"""
@@ -223,7 +254,7 @@ class PlaylistManagerDialog(QDialog):
             return
 
         data = current_item.data(Qt.ItemDataRole.UserRole)
-        is_url = data["is_url"]
+        is_url = data.is_url
 
         # Edit name
         name, ok = QInputDialog.getText(
@@ -242,22 +273,20 @@ class PlaylistManagerDialog(QDialog):
                 self,
                 "Edit Playlist URL",
                 "Enter new URL for playlist:",
-                text=data["path"],
+                text=data.path,
             )
         else:
             path, ok = QFileDialog.getOpenFileName(
                 self,
                 "Select New Playlist File",
-                data["path"],
+                data.path,
                 "M3U Files (*.m3u *.m3u8)",
             )
 
         if ok and path:
             # Update item
             current_item.setText(name)
-            current_item.setData(
-                Qt.ItemDataRole.UserRole, {"path": path, "is_url": is_url}
-            )
+            current_item.setData(Qt.ItemDataRole.UserRole, PlaylistEntry(path, is_url))
 
             # Show success message
             QMessageBox.information(self, "Success", "Playlist updated successfully")
@@ -5,8 +5,7 @@ Module containing the RightPanel widget for video playback and controls.
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import (
     QFrame,
-    QVBoxLayout,
-    QHBoxLayout,
+    QGridLayout,
     QPushButton,
     QSlider,
 )
@@ -24,24 +23,36 @@ class RightPanel(QFrame):
 
     def setup_ui(self):
         """Initialize the UI components."""
-        layout = QVBoxLayout(self)
+        # One grid instead of nested box layouts: the player fills row 0 and
+        # the controls sit side by side on row 1
+        self.grid_layout = QGridLayout(self)
+        self._control_count = 0
 
         # Player widget
         self.player_widget = PlayerWidget()
-        layout.addWidget(self.player_widget)
-
-        # Controls layout
-        self.controls_layout = QHBoxLayout()
+        self.grid_layout.addWidget(self.player_widget, 0, 0, 1, -1)
+        self.grid_layout.setRowStretch(0, 1)
 
         # Add existing controls
         self.play_button = QPushButton("Play")
         self.stop_button = QPushButton("Stop")
         self.volume_slider = QSlider(Qt.Orientation.Horizontal)
+        self.volume_slider.setRange(0, 100)
         self.favorite_button = QPushButton("Favorite")
 
-        self.controls_layout.addWidget(self.play_button)
-        self.controls_layout.addWidget(self.stop_button)
-        self.controls_layout.addWidget(self.volume_slider)
-        self.controls_layout.addWidget(self.favorite_button)
-
-        layout.addLayout(self.controls_layout)
+        for control in (
+            self.play_button,
+            self.stop_button,
+            self.volume_slider,
+            self.favorite_button,
+        ):
+            self.add_control(control)
+
+    def add_control(self, widget):
+        """Append a widget to the end of the controls row.
+
+        Args:
+            widget: The widget to add.
+        """
+        self.grid_layout.addWidget(widget, 1, self._control_count)
+        self._control_count += 1
@@ -4,13 +4,33 @@ Module containing the SearchBar widget for the IPTV Player.
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import QLineEdit
-from utils.styles import SearchBarStyle
+from PyQt6.QtCore import QTimer, pyqtSignal
 
 
 class SearchBar(QLineEdit):
-    """A custom search bar widget with styled appearance."""
+    """A custom search bar widget with styled appearance.
+
+    Emits searchTriggered once the user pauses typing, so consumers filter
+    once per pause instead of on every keystroke.
+    """
+
+    searchTriggered = pyqtSignal(str)
+
+    DEBOUNCE_MS = 300
 
     def __init__(self):
         super().__init__()
         self.setPlaceholderText("🔍 Search channels...")
-        self.setStyleSheet(SearchBarStyle.SEARCH_BAR)
+        # Styled by the QLineEdit#SearchBar rules in the application stylesheet
+        self.setObjectName("SearchBar")
+
+        # Restarted on every edit; fires only after typing pauses
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self._emit_search)
+        self.textChanged.connect(self._debounce_timer.start)
+
+    def _emit_search(self):
+        """Emit searchTriggered with the current text."""
+        self.searchTriggered.emit(self.text())
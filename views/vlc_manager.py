@@ -2,41 +2,112 @@
 
 import os
 import sys
+import collections
+import ctypes
+import ctypes.util
 import logging
-from typing import Optional, Tuple
+import threading
+from typing import List, Optional, Tuple
+
+# pylint: disable=no-name-in-module
+from PyQt6.QtCore import QObject, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
+# Interpreter architecture and platform never change at runtime
+_IS_64BITS = sys.maxsize > 2**32
+_PLATFORM = sys.platform
+_VLC_WIN_PATH = (
+    "C:\\Program Files\\VideoLAN\\VLC"
+    if _IS_64BITS
+    else "C:\\Program Files (x86)\\VideoLAN\\VLC"
+)
+_VLC_DLL_PATH = os.path.join(_VLC_WIN_PATH, "libvlc.dll")
+_VLC_NOT_FOUND_MSG = (
+    f"Error: VLC not found in {_VLC_WIN_PATH}\n"
+    f"Please install {'64' if _IS_64BITS else '32'}-bit VLC"
+)
+
+# libVLC method that binds a player to a native window on this platform
+if _PLATFORM == "win32":
+    _WINDOW_SETTER = "set_hwnd"
+elif _PLATFORM.startswith("linux"):
+    _WINDOW_SETTER = "set_xwindow"
+elif _PLATFORM == "darwin":
+    _WINDOW_SETTER = "set_nsobject"
+else:
+    _WINDOW_SETTER = None
+
+# Platform-native hardware decoder and GPU video output; "any" lets libVLC
+# fall back to whatever module works
+if _PLATFORM == "win32":
+    _HW_DECODER = "d3d11va"
+    _VIDEO_OUTPUT = "direct3d11,any"
+elif _PLATFORM.startswith("linux"):
+    _HW_DECODER = "vaapi"
+    _VIDEO_OUTPUT = "gl,xcb_xv,any"
+elif _PLATFORM == "darwin":
+    _HW_DECODER = "videotoolbox"
+    _VIDEO_OUTPUT = "macosx,any"
+else:
+    _HW_DECODER = "any"
+    _VIDEO_OUTPUT = "any"
+
+# Clock options are instance-wide so they are not re-applied per channel zap
+_INSTANCE_ARGS = (
+    f"--avcodec-hw={_HW_DECODER}",
+    f"--vout={_VIDEO_OUTPUT}",
+    "--clock-jitter=0",
+    "--clock-synchro=0",
+    "--no-audio-time-stretch",
+)
+
+# Size of the in-memory libVLC log kept for bug reports
+_LOG_RING_SIZE = 512
+
+# Messages below this libVLC level (0 debug, 2 notice, 3 warning, 4 error) are
+# dropped in the callback so steady-state playback stays cheap
+_LOG_MIN_LEVEL = 3
+
+# Per-media form of the decoder flag, for builds that ignore the instance one
+HW_DECODE_OPTION = f":avcodec-hw={_HW_DECODER}"
+
 
 class VLCManager:
     """Manages VLC initialization and provides a clean interface for media playback."""
 
     _instance = None
     _vlc = None
+    _result: Optional[Tuple[bool, Optional[str]]] = None
+    _lock = threading.Lock()
+    _log_ring = collections.deque(maxlen=_LOG_RING_SIZE)
+    _log_cb = None
 
     @classmethod
     def initialize(cls) -> Tuple[bool, Optional[str]]:
-        """Initialize VLC environment before application starts."""
-        try:
-            # Try to determine Python architecture
-            is_64bits = sys.maxsize > 2**32
+        """Initialize VLC environment before application starts.
 
+        Only the first call does any work; later calls, from any thread,
+        return the same result and share the same VLC instance.
+        """
+        with cls._lock:
+            result = cls._result
+            if result is None:
+                result = cls._result = cls._load()
+            return result
+
+    @classmethod
+    def _load(cls) -> Tuple[bool, Optional[str]]:
+        """Load libvlc and create the shared VLC instance."""
+        try:
             # Set up Windows environment first
-            if sys.platform == "win32":
-                vlc_path = (
-                    "C:\\Program Files\\VideoLAN\\VLC"
-                    if is_64bits
-                    else "C:\\Program Files (x86)\\VideoLAN\\VLC"
-                )
-                if not os.path.exists(vlc_path):
-                    error_msg = (
-                        f"Error: VLC not found in {vlc_path}\n"
-                        f"Please install {'64' if is_64bits else '32'}-bit VLC"
-                    )
-                    return False, error_msg
+            if _PLATFORM == "win32":
+                # A stat is enough here; import vlc below does the real load
+                if not os.path.isfile(_VLC_DLL_PATH):
+                    return False, _VLC_NOT_FOUND_MSG
 
-                os.environ["PATH"] = vlc_path + ";" + os.environ["PATH"]
-                os.add_dll_directory(vlc_path)
+                os.environ["PATH"] = _VLC_WIN_PATH + ";" + os.environ["PATH"]
+                os.add_dll_directory(_VLC_WIN_PATH)
 
             # Now try to import VLC
             try:
@@ -44,7 +115,17 @@ class VLCManager:
                 import vlc
 
                 cls._vlc = vlc
-                cls._instance = cls._vlc.Instance()
+                cls._instance = cls._vlc.Instance(*_INSTANCE_ARGS)
+                logger.info(
+                    "VLC initialized with %s decoding and %s output",
+                    _HW_DECODER,
+                    _VIDEO_OUTPUT,
+                )
+                try:
+                    cls._attach_log_ring()
+                except (AttributeError, OSError) as e:
+                    # Logging is diagnostics only; never fail playback over it
+                    logger.warning("VLC log capture unavailable: %s", e)
                 return True, None
             except ImportError as e:
                 error_msg = f"Failed to import VLC: {str(e)}"
@@ -56,6 +137,68 @@ class VLCManager:
             logger.error(error_msg)
             return False, error_msg
 
+    @classmethod
+    def _attach_log_ring(cls) -> None:
+        """Route libVLC log messages into a bounded in-memory ring buffer."""
+        if _PLATFORM == "win32":
+            libc, vsnprintf_name = ctypes.cdll.msvcrt, "_vsnprintf"
+        else:
+            libc_path = ctypes.util.find_library("c")
+            if not libc_path:
+                return
+            libc, vsnprintf_name = ctypes.CDLL(libc_path), "vsnprintf"
+        vsnprintf = getattr(libc, vsnprintf_name)
+        vsnprintf.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_char_p, ctypes.c_void_p]
+
+        ring = cls._log_ring
+
+        @cls._vlc.CallbackDecorators.LogCb
+        def log_cb(_data, level, _ctx, fmt, args):
+            if level < _LOG_MIN_LEVEL:
+                return
+            buf = ctypes.create_string_buffer(1024)
+            vsnprintf(buf, len(buf), fmt, ctypes.cast(args, ctypes.c_void_p))
+            # deque.append is atomic, so the libVLC threads need no lock
+            ring.append(buf.value.decode("utf-8", "replace"))
+
+        # Keep a reference so the C callback is never garbage-collected
+        cls._log_cb = log_cb
+        cls._instance.log_set(log_cb, None)
+
+    @classmethod
+    def dump_logs(cls) -> List[str]:
+        """Get the most recent libVLC warnings and errors, oldest first."""
+        return list(cls._log_ring)
+
+    @staticmethod
+    def init_xlib_threads() -> None:
+        """Make Xlib thread-safe so libVLC can use its Xlib video outputs.
+
+        Must be called before the QApplication is created. Does nothing
+        outside Linux or when libX11 is not available (e.g. pure Wayland).
+        """
+        if not _PLATFORM.startswith("linux"):
+            return
+
+        libx11 = ctypes.util.find_library("X11")
+        if not libx11:
+            return
+        try:
+            ctypes.CDLL(libx11).XInitThreads()
+        except (OSError, AttributeError) as e:
+            logger.warning("XInitThreads failed: %s", e)
+
+    @staticmethod
+    def set_output_window(player, win_id) -> None:
+        """Render a player's video into the given native window.
+
+        Args:
+            player: The VLC media player.
+            win_id: The native window handle, e.g. from QWidget.winId().
+        """
+        if _WINDOW_SETTER:
+            getattr(player, _WINDOW_SETTER)(int(win_id))
+
     @classmethod
     def get_instance(cls):
         """Get the VLC instance."""
@@ -72,3 +215,23 @@ class VLCManager:
         if not cls._instance:
             raise RuntimeError("VLC not initialized. Call initialize() first.")
         return cls._instance.media_player_new()
+
+
+class VLCLoader(QObject):
+    """Runs VLCManager.initialize on a worker thread.
+
+    The finished signal is delivered to slots on the GUI thread, where the
+    player can safely be bound to a native window.
+    """
+
+    finished = pyqtSignal(bool, str)
+
+    def start(self) -> None:
+        """Start loading VLC in the background."""
+        thread = threading.Thread(target=self._run, name="vlc-loader", daemon=True)
+        thread.start()
+
+    def _run(self) -> None:
+        """Initialize VLC and report the result."""
+        success, error = VLCManager.initialize()
+        self.finished.emit(success, error or "")